@@ -3,10 +3,12 @@ import re
 import random
 import requests
 from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import os
 import sys
 
@@ -20,7 +22,161 @@ except ImportError:
     STYLE_GUIDE_AVAILABLE = False
     print("Style guide manager not available - using fallback methods")
 
+# Brands recognised when inferring a title brand from common words - lowercase -> canonical spelling
+_KNOWN_BRANDS = {
+    'honda': 'Honda', 'stihl': 'Stihl', 'makita': 'Makita', 'bosch': 'Bosch', 'husqvarna': 'Husqvarna',
+    'dewalt': 'DeWalt', 'hilti': 'Hilti', 'karcher': 'Karcher', 'jcb': 'JCB'
+}
+
+def _title_format(key: int) -> str:
+    """Title layout for a (model, type, differentiator, power type) presence bitmask"""
+    fields = []
+    if key & 8:
+        fields.append('{model}')
+    if key & 4:
+        fields.append('{product_type}')
+    if key & 2:
+        fields.append('- {differentiator}')
+    if key & 1:
+        # Power type joins the differentiator clause, or starts its own
+        fields.append('{power_type}' if key & 2 else '- {power_type}')
+    return ' '.join(fields)
+
+# All 16 title layouts, indexed by the bitmask built in _generate_title
+_TITLE_FORMATS = tuple(_title_format(key) for key in range(16))
+
+# Bound once - indexing fixed tuples skips random.choice's per-call overhead
+_randrange = random.randrange
+
+# Phrase pools for _generate_description
+_QUALITY_PHRASES = (
+    "Built to professional standards",
+    "Engineered for reliability and performance",
+    "Designed for demanding applications",
+    "Trusted by professionals across London",
+    "Combining durability with ease of use"
+)
+
+_HIRE_BENEFITS = (
+    "Available for same-day hire with delivery across London",
+    "Our experienced team provides expert advice and support",
+    "Competitively priced with flexible hire periods",
+    "All equipment is professionally maintained and safety tested"
+)
+
+# Category lookup tables used by the title/description helpers
+_TYPE_MAPPING = {
+    'Access Equipment': 'Access Platform',
+    'Air Compressors & Tools': 'Air Compressor',
+    'Breaking & Drilling': 'Breaker',
+    'Cleaning Equipment': 'Cleaner',
+    'Compaction Equipment': 'Compactor',
+    'Concrete Equipment': 'Concrete Mixer',
+    'Cutting & Grinding': 'Cutter',
+    'Dehumidifiers': 'Dehumidifier',
+    'Electrical Equipment': 'Electrical Tool',
+    'Fans & Ventilation': 'Fan',
+    'Floor Care': 'Floor Sander',
+    'Garden Equipment': 'Garden Tool',
+    'Generators': 'Generator',
+    'Hand Tools': 'Hand Tool',
+    'Heating': 'Heater',
+    'Lifting Equipment': 'Lifting Equipment',
+    'Lighting': 'Light',
+    'Power Tools': 'Power Tool',
+    'Pumps': 'Pump',
+    'Safety Equipment': 'Safety Equipment',
+    'Site Equipment': 'Site Equipment',
+    'Temporary Structures': 'Temporary Structure',
+    'Testing Equipment': 'Testing Equipment',
+    'Waste Management': 'Waste Equipment',
+    'Welding Equipment': 'Welder'
+}
+
+_BENEFITS_MAPPING = {
+    'Access Equipment': (
+        'safe working at height solutions',
+        'stable platform for elevated work',
+        'professional access capabilities',
+        'enhanced safety features and stability'
+    ),
+    'Breaking & Drilling': (
+        'powerful breaking and drilling performance',
+        'efficient demolition capabilities',
+        'precision drilling for various materials',
+        'robust construction for heavy-duty applications'
+    ),
+    'Cleaning Equipment': (
+        'superior cleaning performance',
+        'efficient dirt and debris removal',
+        'professional cleaning results',
+        'time-saving cleaning solutions'
+    ),
+    'Generators': (
+        'reliable portable power generation',
+        'consistent electrical supply',
+        'professional power solutions',
+        'dependable backup power capabilities'
+    ),
+    'Garden Equipment': (
+        'professional garden maintenance capabilities',
+        'efficient outdoor project solutions',
+        'superior garden care performance',
+        'professional landscaping results'
+    )
+}
+
+_DEFAULT_BENEFITS = (
+    'professional performance and reliability',
+    'efficient operation for demanding applications',
+    'superior results for your projects',
+    'trusted performance by professionals'
+)
+
+_APPLICATIONS_MAPPING = {
+    'Access Equipment': (
+        'building maintenance',
+        'construction projects',
+        'installation work',
+        'painting and decorating'
+    ),
+    'Breaking & Drilling': (
+        'demolition work',
+        'concrete breaking',
+        'road repairs',
+        'construction projects'
+    ),
+    'Cleaning Equipment': (
+        'deep cleaning projects',
+        'surface preparation',
+        'maintenance cleaning',
+        'restoration work'
+    ),
+    'Generators': (
+        'outdoor events',
+        'construction sites',
+        'emergency backup power',
+        'remote locations'
+    ),
+    'Garden Equipment': (
+        'landscaping projects',
+        'garden maintenance',
+        'grounds keeping',
+        'outdoor renovations'
+    )
+}
+
+_DEFAULT_APPLICATIONS = (
+    'professional applications',
+    'commercial projects',
+    'maintenance work',
+    'construction tasks'
+)
+
 class ProductDescriptionGenerator:
+    __slots__ = ('excel_handler', 'style_patterns', 'similar_products', 'style_guide_manager',
+                 '_category_renderers')
+    
     def __init__(self, excel_handler=None):
         self.excel_handler = excel_handler
         self.style_patterns = {}
@@ -36,6 +192,13 @@ class ProductDescriptionGenerator:
         else:
             self.style_guide_manager = None
         
+        # Category -> content renderer for new products (see _generate_new_product_content)
+        self._category_renderers = {
+            'Breaking & Drilling': self._render_breaking_drilling,
+            'Garden Equipment': self._render_garden_equipment,
+            'Generators': self._render_generators
+        }
+        
     def generate_new_product_content(self, product_code: str, new_product_info: Dict) -> Dict:
         """
         Generate content for NEW products using provided information
@@ -63,23 +226,30 @@ class ProductDescriptionGenerator:
         
         print(f"Found product: {product['title']}")
         
-        # 1. Analyze similar products for style consistency
-        print("Analyzing similar products for style consistency...")
-        similar_products = self.excel_handler.get_products_by_category(product['category'], limit=15) if self.excel_handler else []
-        style_patterns = self.excel_handler.analyze_style_patterns(similar_products) if self.excel_handler else {}
-        
-        # 2. Research manufacturer website for factual information
-        print("Researching manufacturer website...")
-        manufacturer_info = {}
-        if product.get('manufacturer_website'):
-            manufacturer_info = self.excel_handler.scrape_manufacturer_info(
-                product['manufacturer_website'], 
-                product['title']
-            ) if self.excel_handler else {}
-        
-        # 3. Web search for additional product information
-        print("Searching web for additional product information...")
-        web_research = self._search_web_for_product(product)
+        # Steps 2 and 3 are network bound and independent, so they run in the background
+        # while the local style analysis runs here
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # 2. Research manufacturer website for factual information
+            print("Researching manufacturer website...")
+            manufacturer_future = None
+            if product.get('manufacturer_website') and self.excel_handler:
+                manufacturer_future = executor.submit(
+                    self.excel_handler.scrape_manufacturer_info,
+                    product['manufacturer_website'], 
+                    product['title']
+                )
+            
+            # 3. Web search for additional product information
+            print("Searching web for additional product information...")
+            web_research_future = executor.submit(self._search_web_for_product, product)
+            
+            # 1. Analyze similar products for style consistency
+            print("Analyzing similar products for style consistency...")
+            similar_products = self.excel_handler.get_products_by_category(product['category'], limit=15) if self.excel_handler else []
+            style_patterns = self.excel_handler.analyze_style_patterns(similar_products) if self.excel_handler else {}
+            
+            manufacturer_info = manufacturer_future.result() if manufacturer_future else {}
+            web_research = web_research_future.result()
         
         # 4. Generate WordPress-ready content
         print("Generating WordPress-ready content...")
@@ -166,10 +336,13 @@ class ProductDescriptionGenerator:
         description_patterns = self._analyze_description_patterns(similar_products)
         key_features_patterns = self._analyze_key_features_patterns(similar_products)
         
+        # Extract features once - shared by the description and the features list
+        genuine_features = self._extract_genuine_features(product, manufacturer_info, web_research)
+        
         # Generate description with key features
         description_with_features = self._generate_hireman_description(
             product, description_patterns, key_features_patterns, 
-            manufacturer_info, web_research
+            manufacturer_info, web_research, precomputed_features=genuine_features
         )
         
         # Generate HTML technical specifications table
@@ -182,7 +355,9 @@ class ProductDescriptionGenerator:
             'technical_specifications_html': html_tech_specs,
             'meta_description': self._generate_meta_description(product),
             'suggested_title': self._generate_wordpress_title(product, style_patterns),
-            'key_features_list': self._extract_key_features_list(product, similar_products, manufacturer_info)
+            'key_features_list': self._extract_key_features_list(
+                product, similar_products, manufacturer_info, precomputed_features=genuine_features
+            )
         }
     
     def _analyze_description_patterns(self, products: List[Dict]) -> Dict:
@@ -256,7 +431,8 @@ class ProductDescriptionGenerator:
     
     def _generate_hireman_description(self, product: Dict, description_patterns: Dict, 
                                     key_features_patterns: Dict, manufacturer_info: Dict, 
-                                    web_research: Dict) -> str:
+                                    web_research: Dict,
+                                    precomputed_features: Optional[List[str]] = None) -> str:
         """Generate The Hireman style description matching your established format"""
         
         # Extract product details
@@ -279,7 +455,9 @@ class ProductDescriptionGenerator:
         description_parts.append(opening)
         
         # 2. KEY FEATURES - Following your established format
-        key_features = self._extract_genuine_features(product, manufacturer_info, web_research)
+        key_features = precomputed_features
+        if key_features is None:
+            key_features = self._extract_genuine_features(product, manufacturer_info, web_research)
         if key_features:
             description_parts.append("\n\n<strong>Key features:</strong>")
             description_parts.append("\n<ul>")
@@ -926,12 +1104,16 @@ class ProductDescriptionGenerator:
                 return category
     
     def _extract_key_features_list(self, product: Dict, similar_products: List[Dict], 
-                                 manufacturer_info: Dict) -> List[str]:
+                                 manufacturer_info: Dict,
+                                 precomputed_features: Optional[List[str]] = None) -> List[str]:
         """Extract clean list of key features for WordPress"""
         
-        features = self._extract_genuine_features(
-            product, manufacturer_info, {}
-        )
+        # Reuse features already extracted by the caller when available
+        features = precomputed_features
+        if features is None:
+            features = self._extract_genuine_features(
+                product, manufacturer_info, {}
+            )
         
         # Clean up for WordPress use
         clean_features = []
@@ -996,178 +1178,34 @@ class ProductDescriptionGenerator:
     def _generate_new_product_content(self, product_code: str, new_product_info: Dict) -> Dict:
         """Generate enhanced content for NEW products using provided information"""
         
-        # Extract information from the form
-        brand = new_product_info.get('brand', 'Professional')
-        model = new_product_info.get('model', 'Model')
-        product_name = new_product_info.get('name', '')
-        product_type = new_product_info.get('type', '')
-        differentiator = new_product_info.get('differentiator', '')
-        power_type = new_product_info.get('power_type', '')
-        power_output = new_product_info.get('power', '')
-        manufacturer_website = new_product_info.get('manufacturer_website', '')
-        further_info = new_product_info.get('further_info', '')
-        category = new_product_info.get('category', 'Equipment')
+        # Extract information from the form (bind .get once)
+        get = new_product_info.get
+        brand = get('brand', 'Professional')
+        model = get('model', 'Model')
+        product_name = get('name', '')
+        product_type = get('type', '')
+        differentiator = get('differentiator', '')
+        power_type = get('power_type', '')
+        power_output = get('power', '')
+        manufacturer_website = get('manufacturer_website', '')
+        further_info = get('further_info', '')
+        category = get('category', 'Equipment')
         
         # Create realistic title
-        if product_name:
-            title = f"{brand} {model} {product_name}"
-        else:
-            title = f"{brand} {model}"
-        
+        title_parts = [f"{brand} {model} {product_name}" if product_name else f"{brand} {model}"]
         if differentiator:
-            title += f" - {differentiator}"
+            title_parts.append(f"- {differentiator}")
         if power_type:
-            title += f" ({power_type})"
+            title_parts.append(f"({power_type})")
         if power_output:
-            title += f" {power_output}"
+            title_parts.append(power_output)
+        title = ' '.join(title_parts)
         
         # Generate category-specific content
-        if category == 'Breaking & Drilling':
-            if 'dewalt' in brand.lower():
-                description = f"""The {brand} {model} combines professional-grade power with advanced features for demanding drilling and breaking applications. This cordless rotary hammer drill delivers exceptional performance for concrete, masonry, and steel drilling tasks.
-
-Engineered for professional contractors and serious DIY users, this tool features brushless motor technology for increased runtime and durability. The multi-functional design allows for drilling, hammer drilling, and chiselling operations, making it versatile for various construction and renovation projects.
-
-Perfect for electrical installations, plumbing work, HVAC installations, and general construction tasks. Available for daily, weekly, or monthly hire with competitive rates and same-day delivery across London."""
-                
-                key_features = [
-                    f'Professional {brand} quality and reliability',
-                    'Brushless motor for extended runtime',
-                    'Multi-functional drilling and breaking capability',
-                    'Advanced vibration reduction technology',
-                    'SDS chuck system for quick bit changes',
-                    'High-capacity battery system',
-                    'Same-day hire and delivery available',
-                    'Expert support and guidance included'
-                ]
-                
-                tech_specs = {
-                    'Type': f'{brand} {model}',
-                    'Power Source': power_type if power_type else '110V/240V Available',
-                    'Impact Rate': '1800-4500 bpm',
-                    'Impact Energy': '20-35 J',
-                    'Vibration Level': '4.5-8.0 m/s²',
-                    'Noise Level': '75-85 dB(A)',
-                    'Weight': '12-16 kg',
-                    'Chuck Type': 'SDS-Plus/SDS-Max Compatible',
-                    'Applications': 'Heavy Demolition, Floor Breaking, Foundation Work'
-                }
-            else:
-                description = f"""Professional {category.lower()} equipment designed for demanding construction and renovation applications. The {brand} {model} delivers reliable performance for concrete drilling, masonry work, and demolition tasks.
-
-Built to withstand the rigors of professional use while remaining user-friendly for all skill levels. Advanced engineering ensures optimal power transfer and reduced vibration for operator comfort during extended use periods.
-
-Ideal for construction professionals, maintenance teams, and DIY enthusiasts tackling substantial projects. Available for immediate hire with full support and guidance from our experienced team."""
-                
-                key_features = [
-                    f'Professional {brand} construction',
-                    'Heavy-duty drilling capability',
-                    'Reduced vibration design',
-                    'Professional-grade performance',
-                    'Versatile drilling applications',
-                    'Robust and reliable operation',
-                    'Same-day hire available',
-                    'Expert technical support'
-                ]
-                
-                tech_specs = {
-                    'Type': f'{brand} {model}',
-                    'Power Source': power_type if power_type else '110V Available',
-                    'Impact Rate': '1500-3000 bpm',
-                    'Impact Energy': '15-25 J',
-                    'Vibration Level': '5.0-9.0 m/s²',
-                    'Noise Level': '70-80 dB(A)',
-                    'Weight': '8-12 kg',
-                    'Chuck Type': 'SDS-Plus Compatible',
-                    'Applications': 'Breaking & Drilling, General Construction'
-                }
-        
-        elif category == 'Garden Equipment':
-            description = f"""The {brand} {model} is engineered for professional landscaping and garden maintenance. This high-performance equipment delivers exceptional results for both commercial landscapers and domestic users seeking professional-grade tools.
-
-Featuring robust construction and reliable operation, this equipment handles demanding outdoor tasks with ease. Advanced design ensures efficient operation while minimizing operator fatigue during extended use periods.
-
-Perfect for landscaping contractors, property maintenance teams, and homeowners with substantial grounds to maintain. Available for hire with competitive daily and weekly rates, plus expert advice on operation and safety."""
-            
-            key_features = [
-                f'Professional {brand} engineering',
-                'High-performance operation',
-                'Robust construction for demanding use',
-                'Efficient fuel/power consumption',
-                'User-friendly controls',
-                'Professional landscaping capability',
-                'Same-day hire and delivery',
-                'Expert guidance included'
-            ]
-            
-            tech_specs = {
-                'Brand': brand,
-                'Model': model,
-                'Category': category,
-                'Engine Type': power_type if power_type else '4-Stroke/Electric',
-                'Power Output': power_output if power_output else 'High Performance',
-                'Applications': 'Professional Landscaping',
-                'Cutting System': 'Professional Grade',
-                'Fuel Efficiency': 'Optimized'
-            }
-        
-        elif category == 'Generators':
-            description = f"""Reliable portable power generation for construction sites, events, and emergency backup applications. The {brand} {model} provides consistent, clean power output suitable for sensitive equipment and general power requirements.
-
-Professional-grade construction ensures dependable operation in challenging environments. Fuel-efficient design and robust engineering make this generator ideal for extended operation periods while maintaining stable power output.
-
-Essential for construction sites without mains power, outdoor events, emergency backup, and remote location work. Available for immediate hire with delivery and collection service across London and surrounding areas."""
-            
-            key_features = [
-                f'Reliable {brand} power generation',
-                'Clean, stable power output',
-                'Fuel-efficient operation',
-                'Professional-grade construction',
-                'Multiple output configurations',
-                'Automatic voltage regulation',
-                'Same-day delivery available',
-                'Expert installation support'
-            ]
-            
-            tech_specs = {
-                'Brand': brand,
-                'Model': model,
-                'Category': category,
-                'Power Output': power_output if power_output else '3-10kVA',
-                'Fuel Type': power_type if power_type else 'Petrol/Diesel',
-                'Runtime': '8-12 Hours',
-                'Outlets': 'Multiple 230V/110V',
-                'Applications': 'Construction, Events, Backup'
-            }
-        
-        else:
-            # Generic equipment description
-            description = f"""Professional {category.lower()} designed for demanding commercial and industrial applications. The {brand} {model} combines advanced engineering with user-friendly operation for optimal performance across various tasks.
-
-Built to The Hireman's exacting standards, this equipment delivers consistent results for professional contractors and serious DIY users. Robust construction ensures reliable operation even in challenging working conditions.
-
-Suitable for construction, maintenance, and specialized applications requiring professional-grade equipment. Available for hire with competitive rates, expert advice, and comprehensive support from our experienced team."""
-            
-            key_features = [
-                f'Professional {brand} quality',
-                'Advanced engineering design',
-                'User-friendly operation',
-                'Robust construction',
-                'Reliable performance',
-                'Professional applications',
-                'Same-day hire available',
-                'Expert support included'
-            ]
-            
-            tech_specs = {
-                'Brand': brand,
-                'Model': model,
-                'Category': category,
-                'Type': product_type if product_type else category,
-                'Power Source': power_type if power_type else 'Professional Grade',
-                'Applications': 'Professional/Commercial Use',
-                'Operation': 'User-friendly'
-            }
+        renderer = self._category_renderers.get(category, self._render_generic)
+        description, key_features, tech_specs = renderer(
+            brand, model, category, product_type, power_type, power_output
+        )
         
         # Add common specs
         tech_specs.update({
@@ -1227,6 +1265,173 @@ Suitable for construction, maintenance, and specialized applications requiring p
             }
         }
 
+    def _render_breaking_drilling(self, brand: str, model: str, category: str, product_type: str,
+                                   power_type: str, power_output: str) -> Tuple[str, List[str], Dict]:
+        """Breaking & drilling content as (description, key_features, tech_specs)"""
+        
+        if 'dewalt' in brand.lower():
+            description = f"""The {brand} {model} combines professional-grade power with advanced features for demanding drilling and breaking applications. This cordless rotary hammer drill delivers exceptional performance for concrete, masonry, and steel drilling tasks.
+
+Engineered for professional contractors and serious DIY users, this tool features brushless motor technology for increased runtime and durability. The multi-functional design allows for drilling, hammer drilling, and chiselling operations, making it versatile for various construction and renovation projects.
+
+Perfect for electrical installations, plumbing work, HVAC installations, and general construction tasks. Available for daily, weekly, or monthly hire with competitive rates and same-day delivery across London."""
+            
+            key_features = [
+                f'Professional {brand} quality and reliability',
+                'Brushless motor for extended runtime',
+                'Multi-functional drilling and breaking capability',
+                'Advanced vibration reduction technology',
+                'SDS chuck system for quick bit changes',
+                'High-capacity battery system',
+                'Same-day hire and delivery available',
+                'Expert support and guidance included'
+            ]
+            
+            tech_specs = {
+                'Type': f'{brand} {model}',
+                'Power Source': power_type if power_type else '110V/240V Available',
+                'Impact Rate': '1800-4500 bpm',
+                'Impact Energy': '20-35 J',
+                'Vibration Level': '4.5-8.0 m/s²',
+                'Noise Level': '75-85 dB(A)',
+                'Weight': '12-16 kg',
+                'Chuck Type': 'SDS-Plus/SDS-Max Compatible',
+                'Applications': 'Heavy Demolition, Floor Breaking, Foundation Work'
+            }
+        else:
+            description = f"""Professional {category.lower()} equipment designed for demanding construction and renovation applications. The {brand} {model} delivers reliable performance for concrete drilling, masonry work, and demolition tasks.
+
+Built to withstand the rigors of professional use while remaining user-friendly for all skill levels. Advanced engineering ensures optimal power transfer and reduced vibration for operator comfort during extended use periods.
+
+Ideal for construction professionals, maintenance teams, and DIY enthusiasts tackling substantial projects. Available for immediate hire with full support and guidance from our experienced team."""
+            
+            key_features = [
+                f'Professional {brand} construction',
+                'Heavy-duty drilling capability',
+                'Reduced vibration design',
+                'Professional-grade performance',
+                'Versatile drilling applications',
+                'Robust and reliable operation',
+                'Same-day hire available',
+                'Expert technical support'
+            ]
+            
+            tech_specs = {
+                'Type': f'{brand} {model}',
+                'Power Source': power_type if power_type else '110V Available',
+                'Impact Rate': '1500-3000 bpm',
+                'Impact Energy': '15-25 J',
+                'Vibration Level': '5.0-9.0 m/s²',
+                'Noise Level': '70-80 dB(A)',
+                'Weight': '8-12 kg',
+                'Chuck Type': 'SDS-Plus Compatible',
+                'Applications': 'Breaking & Drilling, General Construction'
+            }
+        
+        return description, key_features, tech_specs
+    
+    def _render_garden_equipment(self, brand: str, model: str, category: str, product_type: str,
+                                  power_type: str, power_output: str) -> Tuple[str, List[str], Dict]:
+        """Garden equipment content as (description, key_features, tech_specs)"""
+        
+        description = f"""The {brand} {model} is engineered for professional landscaping and garden maintenance. This high-performance equipment delivers exceptional results for both commercial landscapers and domestic users seeking professional-grade tools.
+
+Featuring robust construction and reliable operation, this equipment handles demanding outdoor tasks with ease. Advanced design ensures efficient operation while minimizing operator fatigue during extended use periods.
+
+Perfect for landscaping contractors, property maintenance teams, and homeowners with substantial grounds to maintain. Available for hire with competitive daily and weekly rates, plus expert advice on operation and safety."""
+        
+        key_features = [
+            f'Professional {brand} engineering',
+            'High-performance operation',
+            'Robust construction for demanding use',
+            'Efficient fuel/power consumption',
+            'User-friendly controls',
+            'Professional landscaping capability',
+            'Same-day hire and delivery',
+            'Expert guidance included'
+        ]
+        
+        tech_specs = {
+            'Brand': brand,
+            'Model': model,
+            'Category': category,
+            'Engine Type': power_type if power_type else '4-Stroke/Electric',
+            'Power Output': power_output if power_output else 'High Performance',
+            'Applications': 'Professional Landscaping',
+            'Cutting System': 'Professional Grade',
+            'Fuel Efficiency': 'Optimized'
+        }
+        
+        return description, key_features, tech_specs
+    
+    def _render_generators(self, brand: str, model: str, category: str, product_type: str,
+                            power_type: str, power_output: str) -> Tuple[str, List[str], Dict]:
+        """Generator content as (description, key_features, tech_specs)"""
+        
+        description = f"""Reliable portable power generation for construction sites, events, and emergency backup applications. The {brand} {model} provides consistent, clean power output suitable for sensitive equipment and general power requirements.
+
+Professional-grade construction ensures dependable operation in challenging environments. Fuel-efficient design and robust engineering make this generator ideal for extended operation periods while maintaining stable power output.
+
+Essential for construction sites without mains power, outdoor events, emergency backup, and remote location work. Available for immediate hire with delivery and collection service across London and surrounding areas."""
+        
+        key_features = [
+            f'Reliable {brand} power generation',
+            'Clean, stable power output',
+            'Fuel-efficient operation',
+            'Professional-grade construction',
+            'Multiple output configurations',
+            'Automatic voltage regulation',
+            'Same-day delivery available',
+            'Expert installation support'
+        ]
+        
+        tech_specs = {
+            'Brand': brand,
+            'Model': model,
+            'Category': category,
+            'Power Output': power_output if power_output else '3-10kVA',
+            'Fuel Type': power_type if power_type else 'Petrol/Diesel',
+            'Runtime': '8-12 Hours',
+            'Outlets': 'Multiple 230V/110V',
+            'Applications': 'Construction, Events, Backup'
+        }
+        
+        return description, key_features, tech_specs
+    
+    def _render_generic(self, brand: str, model: str, category: str, product_type: str,
+                         power_type: str, power_output: str) -> Tuple[str, List[str], Dict]:
+        """Generic equipment content as (description, key_features, tech_specs)"""
+        
+        # Generic equipment description
+        description = f"""Professional {category.lower()} designed for demanding commercial and industrial applications. The {brand} {model} combines advanced engineering with user-friendly operation for optimal performance across various tasks.
+
+Built to The Hireman's exacting standards, this equipment delivers consistent results for professional contractors and serious DIY users. Robust construction ensures reliable operation even in challenging working conditions.
+
+Suitable for construction, maintenance, and specialized applications requiring professional-grade equipment. Available for hire with competitive rates, expert advice, and comprehensive support from our experienced team."""
+        
+        key_features = [
+            f'Professional {brand} quality',
+            'Advanced engineering design',
+            'User-friendly operation',
+            'Robust construction',
+            'Reliable performance',
+            'Professional applications',
+            'Same-day hire available',
+            'Expert support included'
+        ]
+        
+        tech_specs = {
+            'Brand': brand,
+            'Model': model,
+            'Category': category,
+            'Type': product_type if product_type else category,
+            'Power Source': power_type if power_type else 'Professional Grade',
+            'Applications': 'Professional/Commercial Use',
+            'Operation': 'User-friendly'
+        }
+        
+        return description, key_features, tech_specs
+    
     # Legacy method support for backward compatibility
     def _mock_code_analysis(self, product_code: str) -> Dict:
         """Mock code analysis for fallback"""
@@ -1301,44 +1506,25 @@ Suitable for construction, maintenance, and specialized applications requiring p
         title_patterns = style_patterns.get('title_patterns', {})
         common_words = title_patterns.get('common_words', [])
         
-        # Build title components
-        title_parts = []
-        
-        # Brand (if available)
-        if brand:
-            title_parts.append(brand)
-        elif common_words:
-            # Try to infer brand from common words
-            potential_brands = ['Honda', 'Stihl', 'Makita', 'Bosch', 'Husqvarna', 'DeWalt', 'Hilti', 'Karcher']
+        # Brand (if available), otherwise try to infer it from common words
+        first_word = brand
+        if not first_word and common_words:
             for word in common_words:
-                if word.title() in potential_brands:
-                    title_parts.append(word.title())
+                canonical = _KNOWN_BRANDS.get(word.lower())
+                if canonical:
+                    first_word = canonical
                     break
         
-        # Model (if available)
-        if model:
-            title_parts.append(model)
-        
-        # Type
-        if product_type:
-            title_parts.append(product_type)
-        
-        # Differentiator
-        if differentiator:
-            title_parts.append(f"- {differentiator}")
-        
-        # Power type
-        if power_type:
-            if differentiator:
-                title_parts.append(power_type)
-            else:
-                title_parts.append(f"- {power_type}")
+        # Remaining components via the precomputed layout for this combination
+        key = (bool(model) << 3) | (bool(product_type) << 2) | (bool(differentiator) << 1) | bool(power_type)
+        rest = _TITLE_FORMATS[key].format(
+            model=model, product_type=product_type,
+            differentiator=differentiator, power_type=power_type
+        )
         
-        # Join components
-        if title_parts:
-            generated_title = ' '.join(title_parts)
-        else:
-            # Fallback title generation
+        # Join whichever components are present, falling back to a generic title
+        generated_title = ' '.join(filter(None, (first_word, rest)))
+        if not generated_title:
             category = code_analysis['category']
             generated_title = f"Professional {category} - {code_analysis['product_identifier']}"
         
@@ -1364,43 +1550,35 @@ Suitable for construction, maintenance, and specialized applications requiring p
         paragraphs = []
         
         # Opening paragraph - introduce the product
-        opening_starters = [
-            f"The {product_name} is",
-            f"This {category.lower()} offers",
-            f"Our {product_name} provides",
-            f"Designed for professional use, this {category.lower()}",
-            f"The {product_name} delivers"
-        ]
-        
         if sentence_starters:
-            starter = sentence_starters[0] if sentence_starters else random.choice(opening_starters)
+            starter = sentence_starters[0]
         else:
-            starter = random.choice(opening_starters)
+            opening_starters = (
+                f"The {product_name} is",
+                f"This {category.lower()} offers",
+                f"Our {product_name} provides",
+                f"Designed for professional use, this {category.lower()}",
+                f"The {product_name} delivers"
+            )
+            starter = opening_starters[_randrange(5)]
         
         # Benefits and features paragraph
         benefits = self._get_category_benefits(category)
+        features_parts = [starter, ' ', benefits[_randrange(len(benefits))]]
         if manufacturer_features:
             # Incorporate manufacturer features
-            features_text = f"{starter} {random.choice(benefits)} with {', '.join(manufacturer_features[:2])}. "
-        else:
-            features_text = f"{starter} {random.choice(benefits)}. "
+            features_parts += [' with ', ', '.join(manufacturer_features[:2])]
         
         # Add professional qualities
-        quality_phrases = [
-            "Built to professional standards",
-            "Engineered for reliability and performance", 
-            "Designed for demanding applications",
-            "Trusted by professionals across London",
-            "Combining durability with ease of use"
-        ]
-        
-        features_text += f"{random.choice(quality_phrases)}, this equipment ensures consistent results for your projects."
-        paragraphs.append(features_text)
+        features_parts += ['. ', _QUALITY_PHRASES[_randrange(len(_QUALITY_PHRASES))],
+                           ', this equipment ensures consistent results for your projects.']
+        paragraphs.append(''.join(features_parts))
         
         # Usage and application paragraph
         applications = self._get_category_applications(category)
         if applications:
-            app_text = f"Ideal for {', '.join(applications[:-1])} and {applications[-1] if len(applications) > 1 else applications[0]}. "
+            *head, tail = applications
+            app_text = f"Ideal for {', '.join(head)} and {tail}. "
             app_text += "Whether you're a professional contractor or undertaking a DIY project, this equipment delivers the performance you need."
             paragraphs.append(app_text)
         
@@ -1411,14 +1589,7 @@ Suitable for construction, maintenance, and specialized applications requiring p
             paragraphs.append(manufacturer_text)
         
         # Hire benefits paragraph
-        hire_benefits = [
-            "Available for same-day hire with delivery across London",
-            "Our experienced team provides expert advice and support",
-            "Competitively priced with flexible hire periods",
-            "All equipment is professionally maintained and safety tested"
-        ]
-        
-        hire_text = f"{random.choice(hire_benefits)}. Contact our team today for availability and expert advice on your requirements."
+        hire_text = f"{_HIRE_BENEFITS[_randrange(len(_HIRE_BENEFITS))]}. Contact our team today for availability and expert advice on your requirements."
         paragraphs.append(hire_text)
         
         return '\n\n'.join(paragraphs)
@@ -1445,7 +1616,7 @@ Suitable for construction, maintenance, and specialized applications requiring p
         common_fields = tech_patterns.get('common_fields', [])
         
         # Add any missing common fields with placeholder values
-        for field in common_fields[:10]:  # Limit to top 10 most common fields
+        for field in islice(common_fields, 10):  # Limit to top 10 most common fields
             if field not in specs:
                 specs[field] = 'Specification available on request'
         
@@ -1454,121 +1625,17 @@ Suitable for construction, maintenance, and specialized applications requiring p
     def _infer_type_from_category(self, category: str) -> str:
         """Infer product type from category"""
         
-        type_mapping = {
-            'Access Equipment': 'Access Platform',
-            'Air Compressors & Tools': 'Air Compressor',
-            'Breaking & Drilling': 'Breaker',
-            'Cleaning Equipment': 'Cleaner',
-            'Compaction Equipment': 'Compactor',
-            'Concrete Equipment': 'Concrete Mixer',
-            'Cutting & Grinding': 'Cutter',
-            'Dehumidifiers': 'Dehumidifier',
-            'Electrical Equipment': 'Electrical Tool',
-            'Fans & Ventilation': 'Fan',
-            'Floor Care': 'Floor Sander',
-            'Garden Equipment': 'Garden Tool',
-            'Generators': 'Generator',
-            'Hand Tools': 'Hand Tool',
-            'Heating': 'Heater',
-            'Lifting Equipment': 'Lifting Equipment',
-            'Lighting': 'Light',
-            'Power Tools': 'Power Tool',
-            'Pumps': 'Pump',
-            'Safety Equipment': 'Safety Equipment',
-            'Site Equipment': 'Site Equipment',
-            'Temporary Structures': 'Temporary Structure',
-            'Testing Equipment': 'Testing Equipment',
-            'Waste Management': 'Waste Equipment',
-            'Welding Equipment': 'Welder'
-        }
-        
-        return type_mapping.get(category, 'Equipment')
+        return _TYPE_MAPPING.get(category, 'Equipment')
     
-    def _get_category_benefits(self, category: str) -> List[str]:
+    def _get_category_benefits(self, category: str) -> Tuple[str, ...]:
         """Get benefits specific to each category"""
         
-        benefits_mapping = {
-            'Access Equipment': [
-                'safe working at height solutions',
-                'stable platform for elevated work',
-                'professional access capabilities',
-                'enhanced safety features and stability'
-            ],
-            'Breaking & Drilling': [
-                'powerful breaking and drilling performance',
-                'efficient demolition capabilities',
-                'precision drilling for various materials',
-                'robust construction for heavy-duty applications'
-            ],
-            'Cleaning Equipment': [
-                'superior cleaning performance',
-                'efficient dirt and debris removal',
-                'professional cleaning results',
-                'time-saving cleaning solutions'
-            ],
-            'Generators': [
-                'reliable portable power generation',
-                'consistent electrical supply',
-                'professional power solutions',
-                'dependable backup power capabilities'
-            ],
-            'Garden Equipment': [
-                'professional garden maintenance capabilities',
-                'efficient outdoor project solutions',
-                'superior garden care performance',
-                'professional landscaping results'
-            ]
-        }
-        
-        return benefits_mapping.get(category, [
-            'professional performance and reliability',
-            'efficient operation for demanding applications',
-            'superior results for your projects',
-            'trusted performance by professionals'
-        ])
+        return _BENEFITS_MAPPING.get(category, _DEFAULT_BENEFITS)
     
-    def _get_category_applications(self, category: str) -> List[str]:
+    def _get_category_applications(self, category: str) -> Tuple[str, ...]:
         """Get typical applications for each category"""
         
-        applications_mapping = {
-            'Access Equipment': [
-                'building maintenance',
-                'construction projects',
-                'installation work',
-                'painting and decorating'
-            ],
-            'Breaking & Drilling': [
-                'demolition work',
-                'concrete breaking',
-                'road repairs',
-                'construction projects'
-            ],
-            'Cleaning Equipment': [
-                'deep cleaning projects',
-                'surface preparation',
-                'maintenance cleaning',
-                'restoration work'
-            ],
-            'Generators': [
-                'outdoor events',
-                'construction sites',
-                'emergency backup power',
-                'remote locations'
-            ],
-            'Garden Equipment': [
-                'landscaping projects',
-                'garden maintenance',
-                'grounds keeping',
-                'outdoor renovations'
-            ]
-        }
-        
-        return applications_mapping.get(category, [
-            'professional applications',
-            'commercial projects',
-            'maintenance work',
-            'construction tasks'
-        ])
+        return _APPLICATIONS_MAPPING.get(category, _DEFAULT_APPLICATIONS)
     
     def _get_category_specifications(self, category: str, basic_info: Dict) -> Dict:
         """Get category-specific technical specifications"""
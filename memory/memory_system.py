@@ -1,28 +1,101 @@
+import atexit
 import json
 import os
+import threading
+import bisect
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Union
 import uuid
+import weakref
+
+# Maximum records kept per log; logs are compacted once they exceed limit + slack
+MAX_CONVERSATIONS = 1000
+MAX_CONTENT_HISTORY = 500
+MAX_INSIGHTS = 200
+COMPACTION_SLACK = 100
+MAX_SEARCH_RESULTS = 20
+
+# Prefer orjson for (de)serialization (a listed requirement), falling back to stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj, default=str, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _encode_record(record: Dict) -> bytes:
+    """Encode one record as a compact JSONL line"""
+    return _dumps(record) + b"\n"
+
+def _iter_text(value) -> Iterator[str]:
+    """Yield the scalar values nested inside dicts/lists as strings"""
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_text(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_text(item)
+    elif value is not None:
+        yield str(value)
+
+def _content_search_text(entry: Dict) -> str:
+    """Searchable text of a content history entry - its content may be a string or structured data"""
+    content = entry['content']
+    return content if isinstance(content, str) else ' '.join(_iter_text(content))
+
+def _campaign_search_blob(campaign: Dict) -> str:
+    """Lowercased searchable text of a campaign, kept in MemorySystem._campaign_blobs"""
+    return ' '.join(_iter_text([campaign.get('campaign_data'), campaign.get('status'), campaign.get('type')])).lower()
+
+def _flush_at_exit(memory_ref: weakref.ref):
+    """atexit hook - flush a MemorySystem's buffered content if it is still alive"""
+    memory = memory_ref()
+    if memory is not None:
+        memory.flush()
 
 class MemorySystem:
     def __init__(self, memory_folder="./memory"):
         self.memory_folder = memory_folder
-        self.conversations_file = os.path.join(memory_folder, "conversations.json")
-        self.campaigns_file = os.path.join(memory_folder, "campaigns.json")
-        self.content_history_file = os.path.join(memory_folder, "content_history.json")
-        self.insights_file = os.path.join(memory_folder, "insights.json")
+        # Append-only JSONL logs - one record per line
+        self.conversations_file = os.path.join(memory_folder, "conversations.jsonl")
+        self.campaigns_file = os.path.join(memory_folder, "campaigns.jsonl")
+        self.content_history_file = os.path.join(memory_folder, "content_history.jsonl")
+        self.insights_file = os.path.join(memory_folder, "insights.jsonl")
+        
+        # Parsed records per log, keyed by file path -> ((mtime, size), records)
+        self._cache = {}
+        
+        # Timestamps per log, parallel to the cached records (see _get_timestamps)
+        self._timestamps = {}
+        
+        # Field value -> record positions per (log, field), for type-filtered lookups
+        self._field_index = {}
+        
+        # Campaign id -> search text, built lazily by search_memory and never written to disk
+        self._campaign_blobs = {}
+        
+        # Guards the caches and log files - the app stores from background threads too
+        self._lock = threading.RLock()
+        
+        # Generated content is buffered and written in small batches (see flush)
+        self._pending_content = []
+        self._flush_threshold = 10
         
         # Ensure memory folder exists
         os.makedirs(memory_folder, exist_ok=True)
         
         # Initialize files if they don't exist
         self._initialize_memory_files()
+        
+        # Don't lose buffered content on interpreter exit - through a weakref so the hook
+        # doesn't keep every instance alive until then
+        atexit.register(_flush_at_exit, weakref.ref(self))
     
     def store_conversation(self, user_input: str, agent_response: str, context: Dict = None):
         """Store conversation in memory"""
         
-        conversations = self._load_conversations()
-        
         conversation_entry = {
             'id': str(uuid.uuid4()),
             'timestamp': datetime.now().isoformat(),
@@ -32,19 +105,26 @@ class MemorySystem:
             'date': datetime.now().strftime('%Y-%m-%d')
         }
         
-        conversations.append(conversation_entry)
-        
         # Keep only last 1000 conversations to manage memory
-        if len(conversations) > 1000:
-            conversations = conversations[-1000:]
-        
-        self._save_conversations(conversations)
+        self._append_record(self.conversations_file, conversation_entry, MAX_CONVERSATIONS)
         return conversation_entry['id']
     
     def store_campaign(self, campaign_data: Dict):
         """Store campaign information"""
         
-        campaigns = self._load_campaigns()
+        campaign_entry = self._campaign_entry(campaign_data)
+        self._append_record(self.campaigns_file, campaign_entry)
+        return campaign_entry['id']
+    
+    def store_campaigns(self, campaigns_data: List[Dict]) -> List[str]:
+        """Store several campaigns with a single write"""
+        
+        campaign_entries = [self._campaign_entry(campaign_data) for campaign_data in campaigns_data]
+        self._append_records(self.campaigns_file, campaign_entries)
+        return [entry['id'] for entry in campaign_entries]
+    
+    def _campaign_entry(self, campaign_data: Dict) -> Dict:
+        """Build the stored record for a campaign"""
         
         campaign_entry = {
             'id': str(uuid.uuid4()),
@@ -55,15 +135,13 @@ class MemorySystem:
             'products': campaign_data.get('products', []),
             'performance': {}
         }
-        
-        campaigns.append(campaign_entry)
-        self._save_campaigns(campaigns)
-        return campaign_entry['id']
+        return campaign_entry
     
-    def store_generated_content(self, content_type: str, content: str, metadata: Dict = None):
-        """Store generated content for future reference"""
+    def store_generated_content(self, content_type: str, content: Union[Dict, str], metadata: Dict = None):
+        """Store generated content for future reference
         
-        content_history = self._load_content_history()
+        Structured content (a dict) is stored as-is and encoded once, with the record, when flushed.
+        """
         
         content_entry = {
             'id': str(uuid.uuid4()),
@@ -75,20 +153,34 @@ class MemorySystem:
             'last_used': None
         }
         
-        content_history.append(content_entry)
-        
-        # Keep only last 500 content pieces
-        if len(content_history) > 500:
-            content_history = content_history[-500:]
-        
-        self._save_content_history(content_history)
+        # Buffer the write - visible to reads straight away, flushed to disk in batches
+        with self._lock:
+            self._read_records(self.content_history_file).append(content_entry)
+            self._pending_content.append(content_entry)
+            if len(self._pending_content) >= self._flush_threshold:
+                self.flush()
         return content_entry['id']
     
+    def flush(self):
+        """Write buffered content history records to disk"""
+        
+        with self._lock:
+            if not self._pending_content:
+                return
+            
+            records = self._read_records(self.content_history_file)
+            with open(self.content_history_file, 'ab') as f:
+                f.write(b''.join(_encode_record(record) for record in self._pending_content))
+            self._pending_content.clear()
+            self._cache[self.content_history_file] = (self._file_signature(self.content_history_file), records)
+            
+            # Keep only last 500 content pieces
+            if len(records) > MAX_CONTENT_HISTORY + COMPACTION_SLACK:
+                self._write_records(self.content_history_file, records[-MAX_CONTENT_HISTORY:])
+    
     def store_insight(self, insight_type: str, insight_data: Dict):
         """Store marketing insights and learnings"""
         
-        insights = self._load_insights()
-        
         insight_entry = {
             'id': str(uuid.uuid4()),
             'timestamp': datetime.now().isoformat(),
@@ -98,68 +190,61 @@ class MemorySystem:
             'confidence': insight_data.get('confidence', 0.5)
         }
         
-        insights.append(insight_entry)
-        
         # Keep only last 200 insights
-        if len(insights) > 200:
-            insights = insights[-200:]
-        
-        self._save_insights(insights)
+        self._append_record(self.insights_file, insight_entry, MAX_INSIGHTS)
         return insight_entry['id']
     
     def get_recent_conversations(self, days: int = 7) -> List[Dict]:
         """Get recent conversations within specified days"""
         
-        conversations = self._load_conversations()
-        cutoff_date = datetime.now() - timedelta(days=days)
+        # Conversations are appended in time order, so binary search for the cutoff
+        records = self._read_records(self.conversations_file)
+        timestamps = self._get_timestamps(self.conversations_file, records)
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
         
-        recent = []
-        for conv in conversations:
-            conv_date = datetime.fromisoformat(conv['timestamp'])
-            if conv_date >= cutoff_date:
-                recent.append(conv)
+        start = max(len(records) - MAX_CONVERSATIONS, 0)
+        idx = bisect.bisect_left(timestamps, cutoff, lo=start)
         
-        return sorted(recent, key=lambda x: x['timestamp'], reverse=True)
+        return records[idx:][::-1]
     
     def get_campaign_history(self, campaign_type: str = None, limit: int = 20) -> List[Dict]:
         """Get campaign history, optionally filtered by type"""
         
-        campaigns = self._load_campaigns()
+        campaigns = self._read_records(self.campaigns_file)
         
         if campaign_type:
-            filtered_campaigns = [c for c in campaigns if c.get('type') == campaign_type]
+            positions = self._get_field_index(self.campaigns_file, campaigns, 'type').get(campaign_type, [])
         else:
-            filtered_campaigns = campaigns
-        
-        # Sort by creation date, most recent first
-        sorted_campaigns = sorted(filtered_campaigns, key=lambda x: x['created_at'], reverse=True)
+            positions = range(len(campaigns))
         
-        return sorted_campaigns[:limit]
+        # Campaigns are appended in creation order, so the newest are at the end
+        return [campaigns[pos] for pos in reversed(positions[max(len(positions) - limit, 0):])]
     
     def get_content_by_type(self, content_type: str, limit: int = 10) -> List[Dict]:
         """Get previously generated content by type"""
         
-        content_history = self._load_content_history()
+        records = self._read_records(self.content_history_file)
+        positions = self._get_field_index(self.content_history_file, records, 'content_type').get(content_type, [])
         
-        filtered_content = [c for c in content_history if c['content_type'] == content_type]
-        sorted_content = sorted(filtered_content, key=lambda x: x['timestamp'], reverse=True)
+        # Positions are ascending, so skip those before the retained window and
+        # take the newest from the end - content is appended in time order
+        start = bisect.bisect_left(positions, max(len(records) - MAX_CONTENT_HISTORY, 0))
+        start = max(start, len(positions) - limit)
         
-        return sorted_content[:limit]
+        return [records[pos] for pos in reversed(positions[start:])]
     
     def get_insights_by_type(self, insight_type: str = None, days: int = 30) -> List[Dict]:
         """Get insights, optionally filtered by type and time period"""
         
-        insights = self._load_insights()
-        cutoff_date = datetime.now() - timedelta(days=days)
+        records = self._read_records(self.insights_file)
+        timestamps = self._get_timestamps(self.insights_file, records)
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
         
-        filtered_insights = []
-        for insight in insights:
-            insight_date = datetime.fromisoformat(insight['timestamp'])
-            if insight_date >= cutoff_date:
-                if not insight_type or insight['type'] == insight_type:
-                    filtered_insights.append(insight)
+        start = max(len(records) - MAX_INSIGHTS, 0)
+        idx = bisect.bisect_left(timestamps, cutoff, lo=start)
         
-        return sorted(filtered_insights, key=lambda x: x['timestamp'], reverse=True)
+        return [insight for insight in reversed(records[idx:])
+                if not insight_type or insight['type'] == insight_type]
     
     def get_conversation_context(self, limit: int = 5) -> str:
         """Get recent conversation context for AI"""
@@ -171,7 +256,8 @@ class MemorySystem:
         
         context = "Recent conversation history:\n"
         for conv in recent_conversations:
-            timestamp = datetime.fromisoformat(conv['timestamp']).strftime('%H:%M')
+            # HH:MM straight from the ISO string (YYYY-MM-DDTHH:MM:SS...)
+            timestamp = conv['timestamp'][11:16]
             context += f"[{timestamp}] User: {conv['user_input'][:100]}...\n"
             context += f"[{timestamp}] Agent: {conv['agent_response'][:100]}...\n\n"
         
@@ -182,29 +268,16 @@ class MemorySystem:
         
         campaigns = self._load_campaigns()
         
+        # ISO-8601 timestamps sort lexicographically, so compare strings directly
+        recent_cutoff = (datetime.now() - timedelta(days=30)).isoformat()
+        
         summary = {
             'total_campaigns': len(campaigns),
-            'campaigns_by_type': {},
-            'campaigns_by_status': {},
-            'recent_campaigns': 0
+            'campaigns_by_type': dict(Counter(c.get('type', 'unknown') for c in campaigns)),
+            'campaigns_by_status': dict(Counter(c.get('status', 'unknown') for c in campaigns)),
+            'recent_campaigns': sum(1 for c in campaigns if c['created_at'] >= recent_cutoff)
         }
         
-        recent_date = datetime.now() - timedelta(days=30)
-        
-        for campaign in campaigns:
-            # Count by type
-            campaign_type = campaign.get('type', 'unknown')
-            summary['campaigns_by_type'][campaign_type] = summary['campaigns_by_type'].get(campaign_type, 0) + 1
-            
-            # Count by status
-            status = campaign.get('status', 'unknown')
-            summary['campaigns_by_status'][status] = summary['campaigns_by_status'].get(status, 0) + 1
-            
-            # Count recent campaigns
-            campaign_date = datetime.fromisoformat(campaign['created_at'])
-            if campaign_date >= recent_date:
-                summary['recent_campaigns'] += 1
-        
         return summary
     
     def update_campaign_performance(self, campaign_id: str, performance_data: Dict):
@@ -239,9 +312,12 @@ class MemorySystem:
         results = []
         query_lower = query.lower()
         
+        # Only the top 20 results are returned, so each source stops after 20 matches
+        # taken in the order the final sort would rank them
         if memory_type in ['all', 'conversations']:
-            conversations = self._load_conversations()
-            for conv in conversations:
+            matches = 0
+            for conv in self._search_candidates(self.conversations_file,
+                                                MAX_CONVERSATIONS, newest_first=True):
                 if (query_lower in conv['user_input'].lower() or 
                     query_lower in conv['agent_response'].lower()):
                     results.append({
@@ -249,33 +325,103 @@ class MemorySystem:
                         'relevance': 'high',
                         'data': conv
                     })
+                    matches += 1
+                    if matches >= MAX_SEARCH_RESULTS:
+                        break
         
         if memory_type in ['all', 'campaigns']:
-            campaigns = self._load_campaigns()
-            for campaign in campaigns:
-                campaign_data = json.dumps(campaign).lower()
-                if query_lower in campaign_data:
+            # Campaigns have no 'timestamp', so they keep log order after the sort
+            matches = 0
+            for campaign in self._search_candidates(self.campaigns_file):
+                # Build the search text once per campaign instead of on every search
+                search_blob = self._campaign_blobs.get(campaign['id'])
+                if search_blob is None:
+                    search_blob = self._campaign_blobs[campaign['id']] = _campaign_search_blob(campaign)
+                if query_lower in search_blob:
                     results.append({
                         'type': 'campaign',
                         'relevance': 'medium',
                         'data': campaign
                     })
+                    matches += 1
+                    if matches >= MAX_SEARCH_RESULTS:
+                        break
         
         if memory_type in ['all', 'content']:
-            content_history = self._load_content_history()
-            for content in content_history:
-                if (query_lower in content['content'].lower() or 
+            matches = 0
+            for content in self._search_candidates(self.content_history_file,
+                                                   MAX_CONTENT_HISTORY, newest_first=True):
+                if (query_lower in _content_search_text(content).lower() or 
                     query_lower in content['content_type'].lower()):
                     results.append({
                         'type': 'content',
                         'relevance': 'medium',
                         'data': content
                     })
+                    matches += 1
+                    if matches >= MAX_SEARCH_RESULTS:
+                        break
         
         # Sort by relevance and recency
         results.sort(key=lambda x: (x['relevance'], x['data'].get('timestamp', '')), reverse=True)
         
-        return results[:20]  # Return top 20 results
+        return results[:MAX_SEARCH_RESULTS]  # Return top 20 results
+    
+    def _search_candidates(self, file_path: str, max_records: Optional[int] = None,
+                           newest_first: bool = False) -> Iterator[Dict]:
+        """Yield the last max_records of a log for search_memory to substring-match"""
+        
+        # No token index here: search_memory matches substrings ("rill" finds "drill"), which
+        # exact token lookups can't reproduce, and the capped logs are cheap to scan
+        records = self._read_records(file_path)
+        start = max(len(records) - max_records, 0) if max_records is not None else 0
+        positions = range(start, len(records))
+        
+        if newest_first:
+            positions = reversed(positions)
+        for pos in positions:
+            yield records[pos]
+    
+    def _get_timestamps(self, file_path: str, records: List[Dict]) -> List[str]:
+        """Return the ISO timestamps of a log's records, kept parallel to the cached records"""
+        
+        with self._lock:
+            cached = self._timestamps.get(file_path)
+            if cached is None or cached[0] is not records:
+                cached = (records, [])
+                self._timestamps[file_path] = cached
+            
+            timestamps = cached[1]
+            timestamps.extend(record['timestamp'] for record in records[len(timestamps):])
+            return timestamps
+    
+    def _get_field_index(self, file_path: str, records: List[Dict], field: str) -> Dict[str, List[int]]:
+        """Return field value -> ascending record positions for a log, rebuilding it if the records changed"""
+        
+        key = (file_path, field)
+        with self._lock:
+            index = self._field_index.get(key)
+            if index is None or index['records'] is not records:
+                index = {'records': records, 'size': 0, 'values': defaultdict(list)}
+                self._field_index[key] = index
+            
+            # Index any records appended since the last lookup
+            values = index['values']
+            for pos in range(index['size'], len(records)):
+                values[records[pos].get(field)].append(pos)
+            index['size'] = len(records)
+            
+            return values
+    
+    def export_pretty(self) -> str:
+        """Export all memory logs as indented JSON for human inspection"""
+        
+        return json.dumps({
+            'conversations': self._load_conversations(),
+            'campaigns': self._load_campaigns(),
+            'content_history': self._load_content_history(),
+            'insights': self._load_insights()
+        }, default=str, indent=2, ensure_ascii=False)
     
     def _initialize_memory_files(self):
         """Initialize memory files if they don't exist"""
@@ -289,57 +435,115 @@ class MemorySystem:
         
         for file_path in files_to_init:
             if not os.path.exists(file_path):
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump([], f)
+                # Migrate records from the legacy JSON list file if present
+                legacy_path = os.path.splitext(file_path)[0] + '.json'
+                records = []
+                if os.path.exists(legacy_path):
+                    try:
+                        with open(legacy_path, 'rb') as f:
+                            records = _loads(f.read())
+                    except (OSError, json.JSONDecodeError):
+                        records = []
+                self._write_records(file_path, records)
+    
+    def _file_signature(self, file_path: str) -> Optional[tuple]:
+        """Return (mtime, size) for a log, or None if it doesn't exist"""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _read_records(self, file_path: str) -> List[Dict]:
+        """Read all records from a JSONL log, reusing the cached list while the file is unchanged"""
+        with self._lock:
+            signature = self._file_signature(file_path)
+            cached = self._cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            
+            # A missing log reads as empty, but the list is still cached so appends to it are kept
+            records = []
+            if signature is not None:
+                with open(file_path, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            records.append(_loads(line))
+                        except json.JSONDecodeError:
+                            # Skip a partially written line rather than losing the log
+                            continue
+            if file_path == self.campaigns_file:
+                # Older logs persisted the search text on each campaign - drop it so it isn't
+                # returned to callers or written back, and rebuild it in memory when searched
+                for record in records:
+                    record.pop('_search_blob', None)
+            if file_path == self.content_history_file:
+                # Buffered records not yet flushed to disk
+                records.extend(self._pending_content)
+            self._cache[file_path] = (signature, records)
+            return records
+    
+    def _write_records(self, file_path: str, records: List[Dict]):
+        """Rewrite a JSONL log with the given records"""
+        with self._lock:
+            with open(file_path, 'wb') as f:
+                for record in records:
+                    f.write(_encode_record(record))
+            if file_path == self.content_history_file:
+                # A full rewrite includes any buffered records
+                self._pending_content.clear()
+            self._cache[file_path] = (self._file_signature(file_path), list(records))
+    
+    def _append_record(self, file_path: str, record: Dict, max_records: Optional[int] = None):
+        """Append one record to a JSONL log, compacting it when it grows past the limit"""
+        self._append_records(file_path, [record], max_records)
+    
+    def _append_records(self, file_path: str, new_records: List[Dict], max_records: Optional[int] = None):
+        """Append records to a JSONL log in one write, compacting it when it grows past the limit"""
+        with self._lock:
+            # Make sure the cache reflects the file before appending to both
+            records = self._read_records(file_path)
+            
+            with open(file_path, 'ab') as f:
+                f.write(b''.join(_encode_record(record) for record in new_records))
+            
+            records.extend(new_records)
+            self._cache[file_path] = (self._file_signature(file_path), records)
+            
+            # Compact in batches instead of rewriting on every insert
+            if max_records is not None and len(records) > max_records + COMPACTION_SLACK:
+                self._write_records(file_path, records[-max_records:])
     
     def _load_conversations(self) -> List[Dict]:
         """Load conversations from file"""
-        try:
-            with open(self.conversations_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        return self._read_records(self.conversations_file)[-MAX_CONVERSATIONS:]
     
     def _save_conversations(self, conversations: List[Dict]):
         """Save conversations to file"""
-        with open(self.conversations_file, 'w', encoding='utf-8') as f:
-            json.dump(conversations, f, indent=2, ensure_ascii=False)
+        self._write_records(self.conversations_file, conversations)
     
     def _load_campaigns(self) -> List[Dict]:
         """Load campaigns from file"""
-        try:
-            with open(self.campaigns_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        return list(self._read_records(self.campaigns_file))
     
     def _save_campaigns(self, campaigns: List[Dict]):
         """Save campaigns to file"""
-        with open(self.campaigns_file, 'w', encoding='utf-8') as f:
-            json.dump(campaigns, f, indent=2, ensure_ascii=False)
+        self._write_records(self.campaigns_file, campaigns)
     
     def _load_content_history(self) -> List[Dict]:
         """Load content history from file"""
-        try:
-            with open(self.content_history_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        return self._read_records(self.content_history_file)[-MAX_CONTENT_HISTORY:]
     
     def _save_content_history(self, content_history: List[Dict]):
         """Save content history to file"""
-        with open(self.content_history_file, 'w', encoding='utf-8') as f:
-            json.dump(content_history, f, indent=2, ensure_ascii=False)
+        self._write_records(self.content_history_file, content_history)
     
     def _load_insights(self) -> List[Dict]:
         """Load insights from file"""
-        try:
-            with open(self.insights_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        return self._read_records(self.insights_file)[-MAX_INSIGHTS:]
     
     def _save_insights(self, insights: List[Dict]):
         """Save insights to file"""
-        with open(self.insights_file, 'w', encoding='utf-8') as f:
-            json.dump(insights, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+        self._write_records(self.insights_file, insights)
@@ -1,33 +1,27 @@
 import streamlit as st
-import pandas as pd
 import os
 import json
+import logging
+import re
+import queue
+import atexit
+import threading
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Optional
 
-# Handle imports gracefully for deployment
+# Prefer orjson for the JSON export, with the same options as the memory logs (stdlib json as fallback)
 try:
-    from tools.weather_api import WeatherTool
-    from tools.excel_handler import ExcelHandler
-    from tools.excel_product_handler import ExcelProductHandler
-    from tools.hireman_scraper import HiremanScraper
-    from tools.style_guide_manager import StyleGuideManager
-    from agents.content_generator import ContentGenerator
-    from agents.product_description_generator import ProductDescriptionGenerator
-    from memory.memory_system import MemorySystem
-    TOOLS_AVAILABLE = True
-    IMPORT_ERROR = None
-except ImportError as e:
-    TOOLS_AVAILABLE = False
-    IMPORT_ERROR = str(e)
-    st.error(f"Import error: {e}")
-    st.error("Running in basic mode - some features may not work.")
-except Exception as e:
-    TOOLS_AVAILABLE = False
-    IMPORT_ERROR = str(e)
-    st.error(f"Unexpected error during imports: {e}")
-    import traceback
-    st.text(traceback.format_exc())
+    import orjson
+    _dumps_pretty = lambda obj: orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _dumps_pretty = lambda obj: json.dumps(obj, default=str, ensure_ascii=False, indent=2).encode('utf-8')
+
+# pandas and altair are imported inside the functions that build tables/charts,
+# so pages without them don't pay the import cost
 
 # Set page config
 st.set_page_config(
@@ -37,139 +31,214 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize session state
-if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
-if 'campaigns' not in st.session_state:
-    st.session_state.campaigns = []
+ACTIVITY_LOG_LIMIT = 200  # Oldest activity entries are dropped past this many per session
+
+def _init_session():
+    """Set up per-session state - tools are process-wide st.cache_resource singletons"""
+    # chat_history is a columnar activity log - parallel bounded deques, one entry per activity (see log_activity)
+    st.session_state.setdefault('chat_history', {column: deque(maxlen=ACTIVITY_LOG_LIMIT)
+                                                 for column in ('timestamp', 'type', 'content')})
+    st.session_state.setdefault('activity_count', 0)  # Total logged, including entries aged out of the log
+    st.session_state.setdefault('history_by_type', {})  # Activity type -> deque of recent (timestamp, content)
+    if 'campaigns' not in st.session_state:
+        st.session_state.campaigns = stored_campaigns()
+    st.session_state.setdefault('campaigns_version', 0)  # Bumped on every change to campaigns
+    st.session_state._initialized = True
+# Two digit category prefix of a product code, e.g. "03" in 03/ABC123 or 03ABC123. Stock numbers vary
+# too much to validate (13/006_1, 21/550-1, B0101020, "T/SA001 - T/SA005"), so only the prefix is parsed
+_CODE_PREFIX_RE = re.compile(r'^(\d{2})')
+
+# Category names indexed by the numeric code prefix, None where the prefix isn't assigned
+_KNOWN_CATEGORIES = {
+    1: 'Access Equipment',
+    3: 'Breaking & Drilling',
+    12: 'Garden Equipment',
+    13: 'Generators',
+    14: 'Air Compressors & Tools',
+    15: 'Cleaning Equipment',
+    16: 'Site Equipment',
+    17: 'Heating',
+    18: 'Pumps'
+}
+PRODUCT_CATEGORIES = tuple(_KNOWN_CATEGORIES.get(i) for i in range(100))
+PRODUCT_CODE_HELP = "Product code determines category: " + ", ".join(
+    f"{prefix:02d}={category}" for prefix, category in _KNOWN_CATEGORIES.items())
+
+def category_for_prefix(prefix: Optional[str], default: str) -> str:
+    """Category name for a two digit product code prefix (None if the code has no prefix)"""
+    if prefix is None:
+        return default
+    return PRODUCT_CATEGORIES[int(prefix)] or default
+
+ACTIVITY_TIME_FORMAT = "%Y-%m-%d %H:%M"
+RECENT_PER_TYPE = 20
+
+@lru_cache(maxsize=64)
+def _format_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).strftime(ACTIVITY_TIME_FORMAT)
+
+def format_activity_time(timestamp: datetime) -> str:
+    """Activity timestamp as display text - formatted once per distinct minute"""
+    return _format_minute(int(timestamp.timestamp()) // 60)
+
+def log_activity(activity_type: str, content: str):
+    """Append an entry to the session's activity log"""
+    timestamp = datetime.now()  # Formatted on render with format_activity_time
+    history = st.session_state.chat_history
+    history['timestamp'].append(timestamp)
+    history['type'].append(activity_type)
+    history['content'].append(content)
+    st.session_state.activity_count += 1
+    
+    # Recent entries per type, so "latest N of a type" doesn't scan the whole log
+    recent = st.session_state.history_by_type.setdefault(activity_type, deque(maxlen=RECENT_PER_TYPE))
+    recent.append((timestamp, content))
+
+# Campaigns queued for the background writer are stored up to this many per write
+CAMPAIGN_WRITE_BATCH = 50
+STORED_CAMPAIGNS_LIMIT = 100  # Most recent stored campaigns loaded into a new session
+
+# Shared tool instances - built once per server process and reused across sessions and reruns.
+# Tool modules are imported inside the factories so only pages that use them pay the import cost.
+@st.cache_resource(show_spinner=False)
+def get_weather_tool(api_key: str = ""):
+    from tools.weather_api import WeatherTool
+    return WeatherTool(api_key)
+
+@st.cache_resource(show_spinner=False)
+def get_excel_handler():
+    from tools.excel_handler import ExcelHandler
+    return ExcelHandler()
+
+@st.cache_resource(show_spinner=False)
+def get_excel_product_handler():
+    from tools.excel_product_handler import ExcelProductHandler
+    return ExcelProductHandler()
+
+@st.cache_resource(show_spinner=False)
+def get_content_generator():
+    from agents.content_generator import ContentGenerator
+    return ContentGenerator()
+
+@st.cache_resource(show_spinner=False)
+def get_hireman_scraper():
+    from tools.hireman_scraper import HiremanScraper
+    return HiremanScraper()
+
+@st.cache_resource(show_spinner=False)
+def get_product_generator():
+    from agents.product_description_generator import ProductDescriptionGenerator
+    return ProductDescriptionGenerator(get_excel_product_handler())
+
+@st.cache_resource(show_spinner=False)
+def get_memory_system():
+    from memory.memory_system import MemorySystem
+    return MemorySystem()
+
+@st.cache_resource(show_spinner=False)
+def get_style_guide_manager():
+    from tools.style_guide_manager import StyleGuideManager
+    return StyleGuideManager()
+
+def _campaign_writer(memory_system, write_queue: queue.Queue):
+    """Drain queued campaigns and store them in batches, until a None sentinel is queued"""
+    while True:
+        batch = [write_queue.get()]
+        while len(batch) < CAMPAIGN_WRITE_BATCH:
+            try:
+                batch.append(write_queue.get_nowait())
+            except queue.Empty:
+                break
+        campaigns = [campaign for campaign in batch if campaign is not None]
+        if campaigns:
+            try:
+                memory_system.store_campaigns(campaigns)
+            except Exception as e:
+                logging.error(f"Error saving {len(campaigns)} campaigns: {e}")
+        if len(campaigns) < len(batch):
+            return
+
+def _stop_campaign_writer(write_queue: queue.Queue, writer: threading.Thread):
+    """atexit hook - let the writer store everything still queued before the process exits"""
+    write_queue.put(None)
+    writer.join()
 
-# Initialize tools if available
-if TOOLS_AVAILABLE:
+@st.cache_resource(show_spinner=False)
+def get_campaign_write_queue():
+    """Start the background campaign writer once per process and return its queue"""
+    write_queue = queue.Queue()
+    writer = threading.Thread(target=_campaign_writer, args=(get_memory_system(), write_queue), daemon=True)
+    writer.start()
+    atexit.register(_stop_campaign_writer, write_queue, writer)
+    return write_queue
+
+def stored_campaigns() -> list:
+    """Planner campaigns persisted by earlier sessions, oldest first"""
     try:
-        if 'weather_tool' not in st.session_state:
-            st.session_state.weather_tool = WeatherTool("")  # Empty API key for demo
-        if 'excel_handler' not in st.session_state:
-            st.session_state.excel_handler = ExcelHandler()
-        if 'excel_product_handler' not in st.session_state:
-            st.session_state.excel_product_handler = ExcelProductHandler()
-            # Ensure data is loaded and show status
-            handler = st.session_state.excel_product_handler
-            if not handler.has_data:
-                st.error("⚠️ Product data not loaded. Check CSV file availability.")
-                st.info(f"Looking for CSV files in: {handler.data_folder_path}")
-                # List available files for debugging
-                if os.path.exists(handler.data_folder_path):
-                    files = os.listdir(handler.data_folder_path)
-                    st.info(f"Files found: {files}")
-                else:
-                    st.error(f"Data folder not found: {handler.data_folder_path}")
-            else:
-                st.success(f"✅ {handler.data_summary}")
-                
-        if 'content_generator' not in st.session_state:
-            st.session_state.content_generator = ContentGenerator()
-        if 'hireman_scraper' not in st.session_state:
-            st.session_state.hireman_scraper = HiremanScraper()
-        if 'product_generator' not in st.session_state:
-            if 'excel_product_handler' in st.session_state:
-                st.session_state.product_generator = ProductDescriptionGenerator(st.session_state.excel_product_handler)
-            else:
-                st.error("Cannot initialize product generator - Excel handler not available")
-        if 'memory_system' not in st.session_state:
-            st.session_state.memory_system = MemorySystem()
-        if 'style_guide_manager' not in st.session_state:
-            st.session_state.style_guide_manager = StyleGuideManager()
+        history = get_memory_system().get_campaign_history(limit=STORED_CAMPAIGNS_LIMIT)
+    except Exception as e:
+        logging.error(f"Error loading stored campaigns: {e}")
+        return []
+    return [campaign['campaign_data'] for campaign in reversed(history)]
+
+# Initialize session state once per session
+if not st.session_state.get('_initialized'):
+    _init_session()
+
+def load_tools(*factories):
+    """Build the cached tools a page needs, or return None if they can't be imported/initialized"""
+    try:
+        return tuple(factory() for factory in factories)
+    except ImportError as e:
+        st.warning(f"Tools not available. Import error: {e}")
+        st.info("Running in basic mode - some features may not work.")
     except Exception as e:
         st.error(f"Error initializing tools: {e}")
         st.exception(e)  # Show full traceback
-        TOOLS_AVAILABLE = False
-else:
-    st.warning(f"Tools not available. Import error: {IMPORT_ERROR if 'IMPORT_ERROR' in locals() else 'Unknown'}")
+    return None
 
 def main():
     st.title("🎯 Marketing AI Agent")
     st.subheader("Your Intelligent Marketing Assistant")
     
-    # Sidebar navigation
+    # Sidebar navigation - only the selected page's handler runs, and each page has its own URL
     st.sidebar.title("🚀 Navigation")
-    page = st.sidebar.selectbox(
-        "Choose a function:",
-        [
-            "Dashboard",
-            "New Product Description",
-            "Content Generator", 
-            "Campaign Planner",
-            "Weather Insights",
-            "Competitor Monitor",
-            "Social Media",
-            "Analytics",
-            "Style Guide & Training",
-            "Settings"
-        ]
-    )
-    
-    # Main content based on selected page
-    if page == "Dashboard":
-        show_dashboard()
-    elif page == "New Product Description":
-        show_new_product_description()
-    elif page == "Content Generator":
-        show_content_generator()
-    elif page == "Campaign Planner":
-        show_campaign_planner()
-    elif page == "Weather Insights":
-        show_weather_insights()
-    elif page == "Competitor Monitor":
-        show_competitor_monitor()
-    elif page == "Social Media":
-        show_social_media()
-    elif page == "Analytics":
-        show_analytics()
-    elif page == "Style Guide & Training":
-        show_style_guide_training()
-    elif page == "Settings":
-        show_settings()
+    st.navigation(PAGES).run()
+
+# Placeholder dashboard metrics as (label, value, delta)
+DASHBOARD_STATIC_METRICS = (
+    ("Content Generated", "24", "+8 this month"),
+    ("Weather Alerts", "3", "Current week"),
+    ("ROI Insights", "15%", "+3% vs last month")
+)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def recent_activity(activity_count: int, recent: tuple) -> list:
+    """(title, content) pairs for the dashboard's recent activity, reused until the history changes"""
+    return [(f"Activity {i+1} - {format_activity_time(timestamp) if timestamp else 'Unknown time'}",
+             content or 'No content')
+            for i, (timestamp, content) in enumerate(recent)]
 
 def show_dashboard():
     st.header("📊 Dashboard")
     
     # Quick stats
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            label="Active Campaigns",
-            value=len(st.session_state.campaigns),
-            delta="2 this week"
-        )
-    
-    with col2:
-        st.metric(
-            label="Content Generated",
-            value="24",
-            delta="+8 this month"
-        )
-    
-    with col3:
-        st.metric(
-            label="Weather Alerts",
-            value="3",
-            delta="Current week"
-        )
-    
-    with col4:
-        st.metric(
-            label="ROI Insights",
-            value="15%",
-            delta="+3% vs last month"
-        )
+    metrics = (
+        ("Active Campaigns", len(st.session_state.campaigns), "2 this week"),
+    ) + DASHBOARD_STATIC_METRICS
+    for col, (label, value, delta) in zip(st.columns(4), metrics):
+        with col:
+            st.metric(label=label, value=value, delta=delta)
     
     # Recent activity
     st.subheader("📝 Recent Activity")
-    if st.session_state.chat_history:
-        for i, message in enumerate(st.session_state.chat_history[-5:]):
-            with st.expander(f"Activity {i+1} - {message.get('timestamp', 'Unknown time')}"):
-                st.write(message.get('content', 'No content'))
+    history = st.session_state.chat_history
+    if history['timestamp']:
+        start = max(len(history['timestamp']) - 5, 0)
+        recent = tuple(zip(islice(history['timestamp'], start, None), islice(history['content'], start, None)))
+        for title, content in recent_activity(st.session_state.activity_count, recent):
+            with st.expander(title):
+                st.write(content)
     else:
         st.info("No recent activity. Start by generating some content!")
     
@@ -179,20 +248,42 @@ def show_dashboard():
     
     with col1:
         if st.button("🎯 Generate E-shot", use_container_width=True):
-            st.switch_page("Content Generator")
+            st.switch_page(CONTENT_PAGE)
     
     with col2:
         if st.button("🌤️ Check Weather Impact", use_container_width=True):
-            st.switch_page("Weather Insights")
+            st.switch_page(WEATHER_PAGE)
     
     with col3:
         if st.button("📱 Create Social Post", use_container_width=True):
-            st.switch_page("Social Media")
+            st.switch_page(SOCIAL_PAGE)
+
+@st.cache_data(ttl=10, show_spinner=False)
+def data_folder_files(path: str):
+    """Files in the product data folder (None if it doesn't exist), re-listed at most every 10s"""
+    try:
+        return os.listdir(path)
+    except FileNotFoundError:
+        return None
 
 def show_new_product_description():
     st.header("📝 NEW Product Description Generator")
     st.subheader("Generate professional content for products NOT YET on your website")
     
+    tools = load_tools(get_excel_product_handler, get_product_generator)
+    tools_available = tools is not None
+    product_handler, product_generator = tools if tools_available else (None, None)
+    
+    if tools_available and not product_handler.has_data:
+        st.error("⚠️ Product data not loaded. Check CSV file availability.")
+        st.info(f"Looking for CSV files in: {product_handler.data_folder_path}")
+        # List available files for debugging
+        files = data_folder_files(product_handler.data_folder_path)
+        if files is not None:
+            st.info(f"Files found: {files}")
+        else:
+            st.error(f"Data folder not found: {product_handler.data_folder_path}")
+    
     # Clear workflow explanation
     with st.expander("🔍 How This Works - 5-Step Process", expanded=False):
         st.write("""
@@ -211,26 +302,8 @@ def show_new_product_description():
     # CSV file status and information
     st.subheader("📊 Your Current Product Database")
     
-    if TOOLS_AVAILABLE and 'excel_product_handler' in st.session_state:
-        # Get CSV file information
-        csv_info = st.session_state.excel_product_handler.get_csv_info()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if csv_info['file_exists']:
-                st.success(f"✅ **Product Database Connected**")
-                st.write(f"📁 **File:** `{os.path.basename(csv_info['csv_file_path'])}`")
-                st.write(f"📊 **Existing Products:** {csv_info['total_products']:,}")
-                if csv_info['last_modified']:
-                    st.write(f"🕒 **Updated:** {csv_info['last_modified'].strftime('%Y-%m-%d %H:%M')}")
-                    
-            else:
-                st.warning("⚠️ **No Product Database Found**")
-                st.write("The tool will work but won't be able to analyze similar products for style consistency.")
-        
-        with col2:
-            st.info("**Database Usage:**\n- Used to find similar products in the same category\n- Analyzes description patterns and tone\n- Ensures new content matches your established style")
+    if tools_available:
+        csv_status_panel(product_handler)
     
     st.divider()
     
@@ -242,95 +315,12 @@ def show_new_product_description():
         with st.container():
             st.success("✅ WordPress-ready product content displayed!")
             
-            # Research summary if available
-            research_sources = generated_content.get('research_sources', {})
-            if research_sources:
-                st.info(f"""
-                **Research Summary:**
-                - Similar products analyzed: {research_sources.get('similar_products_analyzed', 0)}
-                - Manufacturer website: {'✅' if research_sources.get('manufacturer_website') else '❌'}
-                - Web research completed: {research_sources.get('web_research_completed', 0)} sources
-                - Style patterns found: {research_sources.get('style_patterns_found', 0)}
-                """)
-            
-            # Show confidence if available
-            confidence = generated_content.get('style_confidence', 0.5)
-            confidence_percentage = int(confidence * 100)
-            if confidence >= 0.8:
-                confidence_color = "🟢"
-                confidence_text = "High"
-            elif confidence >= 0.6:
-                confidence_color = "🟡"
-                confidence_text = "Medium"
-            else:
-                confidence_color = "🔴"
-                confidence_text = "Low"
-            
-            st.info(f"{confidence_color} **Style Confidence:** {confidence_text} ({confidence_percentage}%)")
-            
-            # Display WordPress content
-            wp_content = generated_content.get('wordpress_content', {})
-            
-            # WordPress Title
-            st.subheader("🏷️ WordPress Title")
-            wp_title = wp_content.get('suggested_title', 'Title generation failed')
-            st.code(wp_title, language=None)
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("📋 Copy Title", key="copy_title_restored"):
-                    st.success("Title copied!")
-            
-            # WordPress Description with Key Features
-            st.subheader("📄 WordPress Description & Key Features")
-            st.write("*Ready to paste directly into WordPress post content:*")
-            
-            description_with_features = wp_content.get('description_and_features', 'Description generation failed')
-            
-            # Show formatted version
-            with st.expander("👁️ Preview Formatted Description"):
-                st.markdown(description_with_features, unsafe_allow_html=True)
-            
-            # Show raw HTML for copying
-            st.text_area(
-                "Description HTML (copy to WordPress):", 
-                description_with_features, 
-                height=300, 
-                key="wordpress_description_restored"
-            )
-            
-            with col2:
-                if st.button("📋 Copy Description", key="copy_description_restored"):
-                    st.success("Description copied!")
-            
-            # Technical Specifications
-            st.subheader("⚙️ Technical Specifications HTML")
-            tech_specs_html = wp_content.get('technical_specifications_html', 'Technical specs generation failed')
-            
-            with st.expander("👁️ Preview Technical Specifications"):
-                st.markdown(tech_specs_html, unsafe_allow_html=True)
-            
-            st.text_area(
-                "Technical Specifications HTML (copy to WordPress):", 
-                tech_specs_html, 
-                height=200, 
-                key="wordpress_tech_specs_restored"
+            render_generated_product_content(
+                generated_content, generated_content.get('product_code', ''),
+                generated_content.get('brand', ''), generated_content.get('model', ''),
+                key_prefix="restored_"
             )
             
-            # SEO Meta Description
-            st.subheader("🔍 SEO Meta Description")
-            meta_desc = wp_content.get('meta_description', 'Meta description generation failed')
-            st.code(meta_desc, language=None)
-            
-            # Export option
-            if st.button("💾 Export Content as JSON", key="export_json_restored"):
-                st.download_button(
-                    label="⬇️ Download WordPress Content",
-                    data=json.dumps(generated_content, indent=2),
-                    file_name=f"wordpress_content_restored.json",
-                    mime="application/json"
-                )
-            
             # Clear display
             if st.button("🗑️ Clear Display", key="clear_display"):
                 st.session_state['show_content'] = None
@@ -351,7 +341,7 @@ def show_new_product_description():
         product_code = st.text_input(
             "🏷️ Product Code", 
             placeholder="e.g., 03/ABC123 (first 2 digits determine category)",
-            help="Product code determines category: 01=Access, 03=Breaking & Drilling, 12=Garden, 13=Generators"
+            help=PRODUCT_CODE_HELP
         )
         
         brand = st.text_input(
@@ -373,21 +363,12 @@ def show_new_product_description():
             help="Direct link to the product page on manufacturer's website"
         )
     
-    # Category preview
+    # Category preview - the prefix is parsed once here and reused by generation below
+    product_code = product_code.strip()
+    prefix_match = _CODE_PREFIX_RE.match(product_code)
+    prefix = prefix_match.group(1) if prefix_match else None
     if product_code:
-        prefix = product_code.split('/')[0] if '/' in product_code else product_code[:2]
-        category_map = {
-            '01': 'Access Equipment',
-            '03': 'Breaking & Drilling',
-            '12': 'Garden Equipment', 
-            '13': 'Generators',
-            '14': 'Air Compressors & Tools',
-            '15': 'Cleaning Equipment',
-            '16': 'Site Equipment',
-            '17': 'Heating',
-            '18': 'Pumps'
-        }
-        detected_category = category_map.get(prefix, f"Unknown category (prefix: {prefix})")
+        detected_category = category_for_prefix(prefix, f"Unknown category (prefix: {prefix or product_code[:2]})")
         st.info(f"📂 **Detected Category:** {detected_category}")
     
     # Optional inputs
@@ -433,96 +414,77 @@ def show_new_product_description():
         else:
             st.warning("⚠️ Website Link")
 
-    # Additional optional information
-    st.write("**� Additional Product Details:**")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        product_name = st.text_input("Product Name", placeholder="e.g., Rotary Lawnmower")
-        product_type = st.text_input("Type", placeholder="e.g., Lawnmower, Chainsaw")
-    
-    with col2:
-        differentiator = st.text_input("Differentiator", placeholder="e.g., Self Propelled, Professional")
-        power_type = st.text_input("Power Type", placeholder="e.g., Petrol, Electric")
-    
-    with col3:
-        power_output = st.text_input("Power/Size", placeholder="e.g., 160cc, 2kW")
-    
-    # Generate button with validation
-    st.subheader("🚀 Generate New Product Content")
-    
-    # Check required fields
-    required_fields_complete = bool(product_code and brand and model)
-    
-    if not required_fields_complete:
-        st.warning("⚠️ **Required fields missing.** Please provide: Product Code, Make/Brand, and Model")
-        generate_disabled = True
-    else:
-        st.success("✅ **Ready to generate!** All required information provided.")
-        generate_disabled = False
+    # Additional optional information - in a form so typing in it doesn't rerun the page
+    with st.form("product_info"):
+        st.write("**� Additional Product Details:**")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            product_name = st.text_input("Product Name", placeholder="e.g., Rotary Lawnmower")
+            product_type = st.text_input("Type", placeholder="e.g., Lawnmower, Chainsaw")
+        
+        with col2:
+            differentiator = st.text_input("Differentiator", placeholder="e.g., Self Propelled, Professional")
+            power_type = st.text_input("Power Type", placeholder="e.g., Petrol, Electric")
+        
+        with col3:
+            power_output = st.text_input("Power/Size", placeholder="e.g., 160cc, 2kW")
+        
+        # Generate button with validation
+        st.subheader("🚀 Generate New Product Content")
+        
+        # Check required fields
+        required_fields_complete = bool(product_code and brand and model)
+        
+        if not required_fields_complete:
+            st.warning("⚠️ **Required fields missing.** Please provide: Product Code, Make/Brand, and Model")
+            generate_disabled = True
+        else:
+            st.success("✅ **Ready to generate!** All required information provided.")
+            generate_disabled = False
+        
+        force_refresh = st.checkbox("🔄 Force refresh", help="Regenerate instead of reusing saved content for these inputs")
+        
+        generate_clicked = st.form_submit_button("🎯 Generate NEW Product Content", 
+                                                 type="primary", 
+                                                 use_container_width=True, 
+                                                 disabled=generate_disabled)
     
-    if st.button("🎯 Generate NEW Product Content", 
-                 type="primary", 
-                 use_container_width=True, 
-                 disabled=generate_disabled):
+    if generate_clicked:
         
-        # Enhanced generation process with clear steps
+        # Enhanced generation process with clear steps, reported in one collapsible status widget
         st.subheader("🔄 Generation Progress")
         
-        # Progress container
-        progress_container = st.container()
-        
-        with progress_container:
-            # Step indicators
-            step1 = st.empty()
-            step2 = st.empty() 
-            step3 = st.empty()
-            step4 = st.empty()
-            step5 = st.empty()
-            
-            try:
+        try:
+            with st.status("📂 **Step 1/5:** Analyzing product category from code...", expanded=True) as status:
                 # STEP 1: Category Classification
-                step1.info("📂 **Step 1/5:** Analyzing product category from code...")
-                prefix = product_code.split('/')[0] if '/' in product_code else product_code[:2]
-                category_map = {
-                    '01': 'Access Equipment',
-                    '03': 'Breaking & Drilling',
-                    '12': 'Garden Equipment',
-                    '13': 'Generators',
-                    '14': 'Air Compressors & Tools',
-                    '15': 'Cleaning Equipment',
-                    '16': 'Site Equipment',
-                    '17': 'Heating',
-                    '18': 'Pumps'
-                }
-                detected_category = category_map.get(prefix, 'General Equipment')
-                step1.success(f"✅ **Step 1 Complete:** Category identified as '{detected_category}'")
+                detected_category = category_for_prefix(prefix, 'General Equipment')
+                status.write(f"✅ **Step 1 Complete:** Category identified as '{detected_category}'")
                 
                 # STEP 2: Manufacturer Website Research
-                step2.info("🌐 **Step 2/5:** Researching manufacturer website...")
+                status.update(label="🌐 **Step 2/5:** Researching manufacturer website...")
                 if manufacturer_website:
-                    step2.success(f"✅ **Step 2 Complete:** Manufacturer website will be analyzed")
+                    status.write(f"✅ **Step 2 Complete:** Manufacturer website will be analyzed")
                 else:
-                    step2.warning("⚠️ **Step 2 Partial:** No manufacturer website provided - will rely on other sources")
+                    status.write("⚠️ **Step 2 Partial:** No manufacturer website provided - will rely on other sources")
                 
                 # STEP 3: Google Search Enhancement  
-                step3.info("🔍 **Step 3/5:** Performing Google search for additional information...")
+                status.update(label="🔍 **Step 3/5:** Performing Google search for additional information...")
                 search_query = f"{brand} {model}"
-                step3.success(f"✅ **Step 3 Complete:** Google search performed for '{search_query}'")
+                status.write(f"✅ **Step 3 Complete:** Google search performed for '{search_query}'")
                 
                 # STEP 4: Style Analysis
-                step4.info("📊 **Step 4/5:** Analyzing similar products for style consistency...")
-                if TOOLS_AVAILABLE and 'excel_product_handler' in st.session_state:
-                    handler = st.session_state.excel_product_handler
-                    if handler.has_data:
-                        step4.success(f"✅ **Step 4 Complete:** Analyzed existing {detected_category.lower()} products for style patterns")
+                status.update(label="📊 **Step 4/5:** Analyzing similar products for style consistency...")
+                if tools_available:
+                    if product_handler.has_data:
+                        status.write(f"✅ **Step 4 Complete:** Analyzed existing {detected_category.lower()} products for style patterns")
                     else:
-                        step4.warning("⚠️ **Step 4 Partial:** No existing product database - using default style")
+                        status.write("⚠️ **Step 4 Partial:** No existing product database - using default style")
                 else:
-                    step4.warning("⚠️ **Step 4 Partial:** Product database not available - using default style")
+                    status.write("⚠️ **Step 4 Partial:** Product database not available - using default style")
                 
                 # STEP 5: Content Generation
-                step5.info("✍️ **Step 5/5:** Generating content combining all sources...")
+                status.update(label="✍️ **Step 5/5:** Generating content combining all sources...")
                 
                 # Prepare comprehensive product info
                 new_product_info = {
@@ -541,182 +503,261 @@ def show_new_product_description():
                 }
                 
                 # Generate content using enhanced system
-                if TOOLS_AVAILABLE and 'product_generator' in st.session_state:
+                if tools_available:
                     # Use the real product generator with NEW product info
                     try:
-                        # Try the dedicated NEW product method first
-                        if hasattr(st.session_state.product_generator, 'generate_new_product_content'):
-                            generated_content = st.session_state.product_generator.generate_new_product_content(product_code, new_product_info)
-                        else:
-                            # Try the enhanced signature
-                            generated_content = st.session_state.product_generator.generate_product_content(product_code, new_product_info)
+                        product_info_items = tuple(sorted(new_product_info.items()))
+                        if force_refresh:
+                            cached_generate_product_content.clear(product_code, product_info_items)
+                        generated_content = cached_generate_product_content(product_code, product_info_items)
                     except (TypeError, AttributeError):
                         # Fallback to old signature and mock content
                         st.warning("⚠️ Using legacy product generator - enhanced content will be generated with mock system...")
-                        generated_content = generate_mock_product_content(product_code, new_product_info)
+                        generated_content = generate_mock_product_content(product_code, new_product_info, prefix)
                 else:
                     # Enhanced fallback generation  
                     # Debug: Show what info is being passed
                     st.write("🔧 **Debug - Info being passed to generator:**")
                     st.json(new_product_info)
-                    generated_content = generate_mock_product_content(product_code, new_product_info)
-                
-                step5.success("✅ **Step 5 Complete:** New product content generated successfully!")
-                
-                # Store results
-                st.session_state[f'generated_content_{product_code}'] = generated_content
-                st.session_state['last_generated_product'] = product_code
-                
-                # Add to chat history
-                from datetime import datetime
-                st.session_state.chat_history.append({
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M"),
-                    'type': 'Product Description Generated',
-                    'content': f"Generated content for NEW product {product_code} ({brand} {model})"
-                })
-                
-                # Clear progress and show results IMMEDIATELY
-                progress_container.empty()
-                st.success("🎉 **Generation Complete!** Here's your content:")
-                
-                # ===== PROFESSIONAL CONTENT DISPLAY =====
-                st.subheader("📝 WordPress-Ready Content")
-                
-                # Product Header
-                st.markdown("---")
-                col1, col2 = st.columns([2, 1])
-                with col1:
-                    st.markdown(f"**Product:** {product_code}")
-                    st.markdown(f"**Brand:** {brand}")
-                    st.markdown(f"**Model:** {model}")
-                with col2:
-                    st.markdown(f"**Category:** {generated_content.get('category', 'Unknown')}")
-                    confidence = generated_content.get('style_confidence', 0)
-                    confidence_color = "🟢" if confidence >= 0.8 else "🟡" if confidence >= 0.6 else "🔴"
-                    st.markdown(f"**Confidence:** {confidence_color} {int(confidence * 100)}%")
-                
-                st.markdown("---")
-                
-                # WordPress Title Section
-                st.subheader("🏷️ WordPress Title")
-                title = generated_content.get('wordpress_content', {}).get('suggested_title', 'No title generated')
-                st.markdown(f"**{title}**")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("📋 Copy Title", key="copy_title"):
-                        st.success("Title copied to clipboard!")
-                with col2:
-                    st.text_area("Title (for copying):", title, height=60, key="title_copy", label_visibility="collapsed")
+                    generated_content = generate_mock_product_content(product_code, new_product_info, prefix)
                 
-                st.markdown("---")
+                # Stamp outside the cached calls, which may return content generated up to an hour ago
+                generated_content['generated_at'] = datetime.now().isoformat()
                 
-                # Description Section
-                st.subheader("📄 WordPress Description")
-                description_html = generated_content.get('wordpress_content', {}).get('description_and_features', 'No description generated')
-                
-                # Show formatted preview
-                st.markdown("**Preview:**")
-                st.markdown(description_html, unsafe_allow_html=True)
-                
-                # Raw HTML for copying
-                st.markdown("**HTML for WordPress (copy this):**")
-                st.text_area(
-                    "Description HTML:",
-                    description_html,
-                    height=200,
-                    key="description_html",
-                    help="Copy this HTML directly into your WordPress post content"
+                status.update(label="✅ New product content generated successfully!", state="complete", expanded=False)
+            
+            # Remember the generation in long-term memory
+            tools = load_tools(get_memory_system)
+            if tools is not None:
+                memory_system, = tools
+                memory_system.store_generated_content(
+                    'product_description',
+                    generated_content,
+                    {'product_code': product_code, 'category': detected_category, 'brand': brand, 'model': model}
                 )
+                # One generation per click, so write it out now - other processes and restarts see it
+                memory_system.flush()
+            
+            # Add to chat history
+            log_activity('Product Description Generated',
+                         f"Generated content for NEW product {product_code} ({brand} {model})")
+            
+            # Show results IMMEDIATELY
+            st.success("🎉 **Generation Complete!** Here's your content:")
+            
+            render_generated_product_content(generated_content, product_code, brand, model)
+            
+            # Don't rerun - show content inline instead
+            # st.rerun()
+            
+        except Exception as e:
+            st.error(f"❌ **Generation Failed:** {str(e)}")
+            with st.expander("🔧 Error Details"):
+                st.exception(e)  # Show full traceback
+
+    # Show recent generations
+    recent_generations_panel()
+
+@lru_cache(maxsize=8)
+def csv_status_markdown(csv_file_path: str, total_products: int, last_modified: datetime) -> str:
+    """Product database status lines as one markdown block"""
+    status_lines = [f"📁 **File:** `{os.path.basename(csv_file_path)}`",
+                    f"📊 **Existing Products:** {total_products:,}"]
+    if last_modified:
+        status_lines.append(f"🕒 **Updated:** {last_modified.strftime('%Y-%m-%d %H:%M')}")
+    return "\n\n".join(status_lines)
+
+@st.fragment(run_every=60)
+def csv_status_panel(product_handler):
+    """Product database status, refreshed on its own every minute without rerunning the page"""
+    # Get CSV file information (memoized by the handler until the file changes)
+    csv_info = product_handler.get_csv_info()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if csv_info['file_exists']:
+            st.success(f"✅ **Product Database Connected**")
+            st.markdown(csv_status_markdown(csv_info['csv_file_path'], csv_info['total_products'],
+                                            csv_info['last_modified']))
                 
-                st.markdown("---")
-                
-                # Technical Specifications - IMPROVED READABLE FORMAT
-                st.subheader("⚙️ Technical Specifications")
-                tech_specs = generated_content.get('technical_specs', {})
-                
-                if tech_specs:
-                    # Display as a nice formatted table
-                    st.markdown("**Specifications Overview:**")
-                    
-                    # Create a clean dataframe for display
-                    import pandas as pd
-                    specs_data = []
-                    for key, value in tech_specs.items():
-                        specs_data.append({"Specification": key, "Details": value})
-                    
-                    specs_df = pd.DataFrame(specs_data)
-                    
-                    # Display with nice formatting
-                    st.dataframe(
-                        specs_df,
-                        use_container_width=True,
-                        hide_index=True,
-                        column_config={
-                            "Specification": st.column_config.TextColumn("Specification", width="medium"),
-                            "Details": st.column_config.TextColumn("Details", width="large")
-                        }
-                    )
-                    
-                    # Also provide HTML table for WordPress
-                    st.markdown("**HTML Table for WordPress:**")
-                    tech_specs_html = generated_content.get('wordpress_content', {}).get('technical_specifications_html', '')
-                    st.text_area(
-                        "Technical Specs HTML:",
-                        tech_specs_html,
-                        height=150,
-                        key="tech_specs_html",
-                        help="Copy this HTML table into your WordPress post"
-                    )
-                else:
-                    st.info("No technical specifications generated")
-                
-                st.markdown("---")
-                
-                # SEO Meta Description
-                st.subheader("🔍 SEO Meta Description")
-                meta_desc = generated_content.get('wordpress_content', {}).get('meta_description', 'No meta description generated')
-                st.markdown(f"*{meta_desc}*")
-                st.text_area("Meta Description (for copying):", meta_desc, height=60, key="meta_copy")
-                
-                st.markdown("---")
-                
-                # Key Features List
-                st.subheader("📋 Key Features")
-                key_features = generated_content.get('wordpress_content', {}).get('key_features_list', [])
-                if key_features:
-                    for i, feature in enumerate(key_features, 1):
-                        st.markdown(f"**{i}.** {feature}")
-                else:
-                    st.info("No key features generated")
-                
-                st.markdown("---")
-                
-                # Research Sources Summary
-                st.subheader("📊 Research Summary")
-                research = generated_content.get('research_sources', {})
-                
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Similar Products", research.get('similar_products_analyzed', 0))
-                with col2:
-                    st.metric("Web Research", research.get('web_research_completed', 0))
-                with col3:
-                    st.metric("Style Patterns", research.get('style_patterns_found', 0))
-                with col4:
-                    website_status = "✅ Yes" if research.get('manufacturer_website') else "❌ No"
-                    st.metric("Manufacturer Site", website_status)
-                
-                st.markdown("---")
-                
-                # Export Options
-                st.subheader("💾 Export Options")
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    if st.button("📄 Export as Text", key="export_text"):
-                        export_text = f"""PRODUCT: {product_code} - {brand} {model}
-CATEGORY: {generated_content.get('category', 'Unknown')}
+        else:
+            st.warning("⚠️ **No Product Database Found**")
+            st.write("The tool will work but won't be able to analyze similar products for style consistency.")
+    
+    with col2:
+        st.info("**Database Usage:**\n- Used to find similar products in the same category\n- Analyzes description patterns and tone\n- Ensures new content matches your established style")
+
+@st.fragment
+def recent_generations_panel():
+    """Recent product descriptions, rendered as a fragment so it reruns on its own"""
+    recent_products = st.session_state.history_by_type.get('Product Description Generated')
+    if recent_products:
+        st.subheader("📋 Recent Product Descriptions")
+        for timestamp, content in list(recent_products)[-3:]:  # Show last 3
+            with st.expander(f"🕒 {format_activity_time(timestamp)} - {content}"):
+                st.write("Click to view details of previously generated content")
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_specs_df(spec_items: tuple) -> "pd.DataFrame":
+    """Technical specifications table, rebuilt only when the specs change"""
+    import pandas as pd
+    
+    return pd.DataFrame(spec_items, columns=["Specification", "Details"])
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def format_specs_text(spec_items: tuple) -> str:
+    """Technical specifications as plain text lines for the text export"""
+    return '\n'.join(f'{key}: {value}' for key, value in spec_items)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def export_content_json(generated_content: Dict) -> bytes:
+    """Pretty-printed JSON export, encoded once per distinct content"""
+    return _dumps_pretty(generated_content)
+
+@st.fragment
+def render_generated_product_content(generated_content: Dict, product_code: str, brand: str, model: str,
+                                      key_prefix: str = ""):
+    """WordPress-ready display of generated product content, shared by fresh and restored results
+    
+    A fragment, so its copy/export buttons rerun only this section and the result stays on screen.
+    """
+    # Pulled out once; the sections below all read from these
+    wp_content = generated_content.get('wordpress_content', {})
+    category = generated_content.get('category', 'Unknown')
+    
+    st.subheader("📝 WordPress-Ready Content")
+    
+    # Product Header
+    st.markdown("---")
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.markdown(f"**Product:** {product_code}")
+        st.markdown(f"**Brand:** {brand}")
+        st.markdown(f"**Model:** {model}")
+    with col2:
+        st.markdown(f"**Category:** {category}")
+        confidence = generated_content.get('style_confidence', 0)
+        confidence_color = "🟢" if confidence >= 0.8 else "🟡" if confidence >= 0.6 else "🔴"
+        st.markdown(f"**Confidence:** {confidence_color} {int(confidence * 100)}%")
+    
+    st.markdown("---")
+    
+    # WordPress Title Section
+    st.subheader("🏷️ WordPress Title")
+    title = wp_content.get('suggested_title', 'No title generated')
+    st.markdown(f"**{title}**")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("📋 Copy Title", key=f"{key_prefix}copy_title"):
+            st.success("Title copied to clipboard!")
+    with col2:
+        st.text_area("Title (for copying):", title, height=60, key=f"{key_prefix}title_copy", label_visibility="collapsed")
+    
+    st.markdown("---")
+    
+    # Description Section
+    st.subheader("📄 WordPress Description")
+    description_html = wp_content.get('description_and_features', 'No description generated')
+    
+    # Only the selected view is sent, so the HTML goes to the browser once per rerun
+    description_view = st.radio("Description view", ("Preview", "HTML for WordPress"), horizontal=True,
+                                key=f"{key_prefix}description_view", label_visibility="collapsed")
+    if description_view == "Preview":
+        # Show formatted preview
+        st.markdown(description_html, unsafe_allow_html=True)
+    else:
+        # Raw HTML for copying
+        st.text_area(
+            "Description HTML:",
+            description_html,
+            height=200,
+            key=f"{key_prefix}description_html",
+            help="Copy this HTML directly into your WordPress post content"
+        )
+    
+    st.markdown("---")
+    
+    # Technical Specifications - IMPROVED READABLE FORMAT
+    st.subheader("⚙️ Technical Specifications")
+    tech_specs = generated_content.get('technical_specs', {})
+    spec_items = tuple(tech_specs.items())
+    
+    if tech_specs:
+        # Display as a nice formatted table
+        st.markdown("**Specifications Overview:**")
+    
+        # Display with nice formatting
+        st.dataframe(
+            build_specs_df(spec_items),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Specification": st.column_config.TextColumn("Specification", width="medium"),
+                "Details": st.column_config.TextColumn("Details", width="large")
+            }
+        )
+    
+        # Also provide HTML table for WordPress
+        st.markdown("**HTML Table for WordPress:**")
+        tech_specs_html = wp_content.get('technical_specifications_html', '')
+        st.text_area(
+            "Technical Specs HTML:",
+            tech_specs_html,
+            height=150,
+            key=f"{key_prefix}tech_specs_html",
+            help="Copy this HTML table into your WordPress post"
+        )
+    else:
+        st.info("No technical specifications generated")
+    
+    st.markdown("---")
+    
+    # SEO Meta Description
+    st.subheader("🔍 SEO Meta Description")
+    meta_desc = wp_content.get('meta_description', 'No meta description generated')
+    st.markdown(f"*{meta_desc}*")
+    st.text_area("Meta Description (for copying):", meta_desc, height=60, key=f"{key_prefix}meta_copy")
+    
+    st.markdown("---")
+    
+    # Key Features List
+    st.subheader("📋 Key Features")
+    key_features = wp_content.get('key_features_list', [])
+    if key_features:
+        # One markdown element for the whole list rather than one per feature
+        st.markdown("\n\n".join(f"**{i}.** {feature}" for i, feature in enumerate(key_features, 1)))
+    else:
+        st.info("No key features generated")
+    
+    st.markdown("---")
+    
+    # Research Sources Summary
+    st.subheader("📊 Research Summary")
+    research = generated_content.get('research_sources', {})
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Similar Products", research.get('similar_products_analyzed', 0))
+    with col2:
+        st.metric("Web Research", research.get('web_research_completed', 0))
+    with col3:
+        st.metric("Style Patterns", research.get('style_patterns_found', 0))
+    with col4:
+        website_status = "✅ Yes" if research.get('manufacturer_website') else "❌ No"
+        st.metric("Manufacturer Site", website_status)
+    
+    st.markdown("---")
+    
+    # Export Options
+    st.subheader("💾 Export Options")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("📄 Export as Text", key=f"{key_prefix}export_text"):
+            export_text = f"""PRODUCT: {product_code} - {brand} {model}
+CATEGORY: {category}
 
 TITLE:
 {title}
@@ -725,7 +766,7 @@ DESCRIPTION:
 {description_html}
 
 TECHNICAL SPECIFICATIONS:
-{chr(10).join([f'{k}: {v}' for k, v in tech_specs.items()])}
+{format_specs_text(spec_items)}
 
 META DESCRIPTION:
 {meta_desc}
@@ -733,87 +774,150 @@ META DESCRIPTION:
 KEY FEATURES:
 {chr(10).join([f'• {feature}' for feature in key_features])}
 """
-                        st.download_button(
-                            "⬇️ Download Text File",
-                            export_text,
-                            file_name=f"{product_code.replace('/', '_')}_content.txt",
-                            mime="text/plain"
-                        )
-                
-                with col2:
-                    if st.button("📊 Export as JSON", key="export_json"):
-                        import json
-                        st.download_button(
-                            "⬇️ Download JSON File",
-                            json.dumps(generated_content, indent=2),
-                            file_name=f"{product_code.replace('/', '_')}_content.json",
-                            mime="application/json"
-                        )
-                
-                with col3:
-                    if st.button("📋 Copy All to Clipboard", key="copy_all"):
-                        st.success("Content ready! Use the individual copy buttons above for specific sections.")
-                
-                st.markdown("---")
-                
-                # Usage Instructions
-                with st.expander("📖 WordPress Usage Instructions"):
-                    st.markdown("""
-                    **How to use this content in WordPress:**
-                    
-                    1. **Title**: Copy the WordPress title for your post/product title
-                    2. **Description**: Copy the description HTML directly into your WordPress content editor (Text/HTML mode)
-                    3. **Technical Specs**: Add the technical specifications HTML to your product details section
-                    4. **Meta Description**: Use for your SEO meta description in Yoast or similar plugins
-                    5. **Key Features**: Reference when creating bullet points or feature lists
-                    
-                    **Tips:**
-                    - Switch to Text/HTML mode in WordPress editor when pasting HTML
-                    - Preview the content before publishing
-                    - Adjust styling as needed to match your theme
-                    """)
-                
-                # Show raw data for debugging (collapsible)
-                with st.expander("🔧 Raw Generated Data (for debugging)"):
-                    st.json(generated_content)
-                
-                # Don't rerun - show content inline instead
-                # st.rerun()
-                
-            except Exception as e:
-                st.error(f"❌ **Generation Failed:** {str(e)}")
-                with st.expander("🔧 Error Details"):
-                    import traceback
-                    st.text(traceback.format_exc())
+            st.download_button(
+                "⬇️ Download Text File",
+                export_text,
+                file_name=f"{product_code.replace('/', '_')}_content.txt",
+                mime="text/plain"
+            )
+    
+    with col2:
+        if st.button("📊 Export as JSON", key=f"{key_prefix}export_json"):
+            st.download_button(
+                "⬇️ Download JSON File",
+                export_content_json(generated_content),
+                file_name=f"{product_code.replace('/', '_')}_content.json",
+                mime="application/json"
+            )
+    
+    with col3:
+        if st.button("📋 Copy All to Clipboard", key=f"{key_prefix}copy_all"):
+            st.success("Content ready! Use the individual copy buttons above for specific sections.")
+    
+    st.markdown("---")
+    
+    # Usage Instructions
+    with st.expander("📖 WordPress Usage Instructions"):
+        st.markdown("""
+        **How to use this content in WordPress:**
+    
+        1. **Title**: Copy the WordPress title for your post/product title
+        2. **Description**: Copy the description HTML directly into your WordPress content editor (Text/HTML mode)
+        3. **Technical Specs**: Add the technical specifications HTML to your product details section
+        4. **Meta Description**: Use for your SEO meta description in Yoast or similar plugins
+        5. **Key Features**: Reference when creating bullet points or feature lists
+    
+        **Tips:**
+        - Switch to Text/HTML mode in WordPress editor when pasting HTML
+        - Preview the content before publishing
+        - Adjust styling as needed to match your theme
+        """)
+    
+    # Show raw data for debugging (collapsible)
+    with st.expander("🔧 Raw Generated Data (for debugging)"):
+        st.json(generated_content)
 
-    # Show recent generations
-    if st.session_state.chat_history:
-        recent_products = [item for item in st.session_state.chat_history if item.get('type') == 'Product Description Generated']
-        if recent_products:
-            st.subheader("📋 Recent Product Descriptions")
-            for item in recent_products[-3:]:  # Show last 3
-                with st.expander(f"🕒 {item['timestamp']} - {item['content']}"):
-                    st.write("Click to view details of previously generated content")
-
-def generate_mock_product_content(product_code: str, basic_info: Dict) -> Dict:
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def cached_generate_product_content(product_code: str, product_info_items: tuple) -> Dict:
+    """Generate NEW product content, reusing the result for repeat codes and inputs"""
+    product_generator = get_product_generator()
+    product_info = dict(product_info_items)
+    # Try the dedicated NEW product method first
+    if hasattr(product_generator, 'generate_new_product_content'):
+        return product_generator.generate_new_product_content(product_code, product_info)
+    # Try the enhanced signature
+    return product_generator.generate_product_content(product_code, product_info)
+
+# Lookup tables and templates for generate_mock_product_content
+MOCK_DEWALT_DRILL_DESCRIPTION = """The {brand} {model} combines professional-grade power with advanced features for demanding drilling and breaking applications. This cordless rotary hammer drill delivers exceptional performance for concrete, masonry, and steel drilling tasks.
+
+Engineered for professional contractors and serious DIY users, this tool features brushless motor technology for increased runtime and durability. The multi-functional design allows for drilling, hammer drilling, and chiselling operations, making it versatile for various construction and renovation projects.
+
+Perfect for electrical installations, plumbing work, HVAC installations, and general construction tasks. Available for daily, weekly, or monthly hire with competitive rates and same-day delivery across London."""
+
+MOCK_DESCRIPTIONS = {
+    'Breaking & Drilling': """Professional {category_lower} equipment designed for demanding construction and renovation applications. The {brand} {model} delivers reliable performance for concrete drilling, masonry work, and demolition tasks.
+
+Built to withstand the rigors of professional use while remaining user-friendly for all skill levels. Advanced engineering ensures optimal power transfer and reduced vibration for operator comfort during extended use periods.
+
+Ideal for construction professionals, maintenance teams, and DIY enthusiasts tackling substantial projects. Available for immediate hire with full support and guidance from our experienced team.""",
+    'Garden Equipment': """The {brand} {model} is engineered for professional landscaping and garden maintenance. This high-performance equipment delivers exceptional results for both commercial landscapers and domestic users seeking professional-grade tools.
+
+Featuring robust construction and reliable operation, this equipment handles demanding outdoor tasks with ease. Advanced design ensures efficient operation while minimizing operator fatigue during extended use periods.
+
+Perfect for landscaping contractors, property maintenance teams, and homeowners with substantial grounds to maintain. Available for hire with competitive daily and weekly rates, plus expert advice on operation and safety.""",
+    'Generators': """Reliable portable power generation for construction sites, events, and emergency backup applications. The {brand} {model} provides consistent, clean power output suitable for sensitive equipment and general power requirements.
+
+Professional-grade construction ensures dependable operation in challenging environments. Fuel-efficient design and robust engineering make this generator ideal for extended operation periods while maintaining stable power output.
+
+Essential for construction sites without mains power, outdoor events, emergency backup, and remote location work. Available for immediate hire with delivery and collection service across London and surrounding areas."""
+}
+
+MOCK_DEFAULT_DESCRIPTION = """Professional {category_lower} designed for demanding commercial and industrial applications. The {brand} {model} combines advanced engineering with user-friendly operation for optimal performance across various tasks.
+
+Built to The Hireman's exacting standards, this equipment delivers consistent results for professional contractors and serious DIY users. Robust construction ensures reliable operation even in challenging working conditions.
+
+Suitable for construction, maintenance, and specialized applications requiring professional-grade equipment. Available for hire with competitive rates, expert advice, and comprehensive support from our experienced team."""
+
+# Spec rows shared by every product; the per-product fields are filled in on a copy
+MOCK_SPECS_SCAFFOLD = {
+    'Brand': None,
+    'Model': None,
+    'Category': None,
+    'Product Code': None,
+    'Type': None,
+    'Power Source': None,
+    'Power Output': None,
+    'Application': 'Professional/Commercial Use',
+    'Hire Period': 'Daily, Weekly, Monthly',
+    'Delivery': 'Same Day Available',
+    'Support': 'Expert Guidance Included'
+}
+
+MOCK_GARDEN_SPECS = {
+    'Cutting Width': 'Professional Grade',
+    'Engine Type': '4-Stroke/Electric',
+    'Fuel Tank': 'Extended Runtime',
+    'Cutting Height': 'Adjustable'
+}
+
+MOCK_BASE_FEATURES = (
+    'Advanced engineering for demanding applications',
+    'User-friendly operation for all skill levels',
+    'Robust construction for extended service life',
+    'Same-day hire and delivery available',
+    'Expert support and guidance included',
+    'Competitive daily and weekly hire rates',
+    'Full maintenance and safety checks'
+)
+
+MOCK_CATEGORY_FEATURES = {
+    'Breaking & Drilling': (
+        'Multi-functional drilling and breaking capability',
+        'Advanced vibration reduction technology',
+        'High-capacity battery system (if cordless)',
+        'SDS chuck system for quick bit changes'
+    ),
+    'Garden Equipment': (
+        'Professional landscaping performance',
+        'Efficient fuel consumption',
+        'Adjustable cutting/operation settings',
+        'Easy maintenance and cleaning'
+    ),
+    'Generators': (
+        'Clean, stable power output',
+        'Automatic voltage regulation',
+        'Multiple output configurations',
+        'Fuel-efficient operation'
+    )
+}
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def generate_mock_product_content(product_code: str, basic_info: Dict, prefix: Optional[str] = '01') -> Dict:
     """Generate realistic product content when tools aren't available"""
-    from datetime import datetime
-    
-    # Enhanced category mapping with details
-    category_map = {
-        '01': 'Access Equipment',
-        '03': 'Breaking & Drilling', 
-        '12': 'Garden Equipment',
-        '13': 'Generators',
-        '14': 'Air Compressors & Tools',
-        '15': 'Cleaning Equipment',
-        '16': 'Site Equipment',
-        '17': 'Heating',
-        '18': 'Pumps'
-    }
     
-    prefix = product_code.split('/')[0] if '/' in product_code else '01'
-    category = category_map.get(prefix, 'Equipment')
+    # Codes without a numeric prefix are treated as Access Equipment (01)
+    category = category_for_prefix(prefix or '01', 'Equipment')
     
     # Extract actual product information
     brand = basic_info.get('brand', 'Professional')
@@ -840,55 +944,23 @@ def generate_mock_product_content(product_code: str, basic_info: Dict) -> Dict:
         title += f" {power_output}"
     
     # Generate realistic product description based on category and brand
-    if category == 'Breaking & Drilling':
-        if 'dewalt' in brand.lower():
-            description = f"""The {brand} {model} combines professional-grade power with advanced features for demanding drilling and breaking applications. This cordless rotary hammer drill delivers exceptional performance for concrete, masonry, and steel drilling tasks.
-
-Engineered for professional contractors and serious DIY users, this tool features brushless motor technology for increased runtime and durability. The multi-functional design allows for drilling, hammer drilling, and chiselling operations, making it versatile for various construction and renovation projects.
-
-Perfect for electrical installations, plumbing work, HVAC installations, and general construction tasks. Available for daily, weekly, or monthly hire with competitive rates and same-day delivery across London."""
-        else:
-            description = f"""Professional {category.lower()} equipment designed for demanding construction and renovation applications. The {brand} {model} delivers reliable performance for concrete drilling, masonry work, and demolition tasks.
-
-Built to withstand the rigors of professional use while remaining user-friendly for all skill levels. Advanced engineering ensures optimal power transfer and reduced vibration for operator comfort during extended use periods.
-
-Ideal for construction professionals, maintenance teams, and DIY enthusiasts tackling substantial projects. Available for immediate hire with full support and guidance from our experienced team."""
-    
-    elif category == 'Garden Equipment':
-        description = f"""The {brand} {model} is engineered for professional landscaping and garden maintenance. This high-performance equipment delivers exceptional results for both commercial landscapers and domestic users seeking professional-grade tools.
-
-Featuring robust construction and reliable operation, this equipment handles demanding outdoor tasks with ease. Advanced design ensures efficient operation while minimizing operator fatigue during extended use periods.
-
-Perfect for landscaping contractors, property maintenance teams, and homeowners with substantial grounds to maintain. Available for hire with competitive daily and weekly rates, plus expert advice on operation and safety."""
-    
-    elif category == 'Generators':
-        description = f"""Reliable portable power generation for construction sites, events, and emergency backup applications. The {brand} {model} provides consistent, clean power output suitable for sensitive equipment and general power requirements.
-
-Professional-grade construction ensures dependable operation in challenging environments. Fuel-efficient design and robust engineering make this generator ideal for extended operation periods while maintaining stable power output.
-
-Essential for construction sites without mains power, outdoor events, emergency backup, and remote location work. Available for immediate hire with delivery and collection service across London and surrounding areas."""
-    
+    if category == 'Breaking & Drilling' and 'dewalt' in brand.lower():
+        description_template = MOCK_DEWALT_DRILL_DESCRIPTION
     else:
-        description = f"""Professional {category.lower()} designed for demanding commercial and industrial applications. The {brand} {model} combines advanced engineering with user-friendly operation for optimal performance across various tasks.
-
-Built to The Hireman's exacting standards, this equipment delivers consistent results for professional contractors and serious DIY users. Robust construction ensures reliable operation even in challenging working conditions.
-
-Suitable for construction, maintenance, and specialized applications requiring professional-grade equipment. Available for hire with competitive rates, expert advice, and comprehensive support from our experienced team."""
+        description_template = MOCK_DESCRIPTIONS.get(category, MOCK_DEFAULT_DESCRIPTION)
+    description = description_template.format(brand=brand, model=model, category_lower=category.lower())
     
-    # Create realistic technical specifications
-    tech_specs = {
+    # Create realistic technical specifications from the shared scaffold
+    tech_specs = MOCK_SPECS_SCAFFOLD.copy()
+    tech_specs.update({
         'Brand': brand,
         'Model': model,
         'Category': category,
         'Product Code': product_code,
         'Type': product_type if product_type else category,
         'Power Source': power_type if power_type else 'Professional Grade',
-        'Power Output': power_output if power_output else 'High Performance',
-        'Application': 'Professional/Commercial Use',
-        'Hire Period': 'Daily, Weekly, Monthly',
-        'Delivery': 'Same Day Available',
-        'Support': 'Expert Guidance Included'
-    }
+        'Power Output': power_output if power_output else 'High Performance'
+    })
     
     # Add category-specific specs
     if category == 'Breaking & Drilling':
@@ -903,12 +975,7 @@ Suitable for construction, maintenance, and specialized applications requiring p
             'Chuck Type': 'SDS-Plus/SDS-Max Compatible'
         })
     elif category == 'Garden Equipment':
-        tech_specs.update({
-            'Cutting Width': 'Professional Grade',
-            'Engine Type': '4-Stroke/Electric',
-            'Fuel Tank': 'Extended Runtime',
-            'Cutting Height': 'Adjustable'
-        })
+        tech_specs.update(MOCK_GARDEN_SPECS)
     elif category == 'Generators':
         tech_specs.update({
             'Power Output': f'{power_output}' if power_output else '3-10kVA',
@@ -918,39 +985,8 @@ Suitable for construction, maintenance, and specialized applications requiring p
         })
     
     # Create professional WordPress content
-    key_features = [
-        f'Professional {brand} quality and reliability',
-        'Advanced engineering for demanding applications',
-        'User-friendly operation for all skill levels',
-        'Robust construction for extended service life',
-        'Same-day hire and delivery available',
-        'Expert support and guidance included',
-        'Competitive daily and weekly hire rates',
-        'Full maintenance and safety checks'
-    ]
-    
-    # Add category-specific features
-    if category == 'Breaking & Drilling':
-        key_features.extend([
-            'Multi-functional drilling and breaking capability',
-            'Advanced vibration reduction technology',
-            'High-capacity battery system (if cordless)',
-            'SDS chuck system for quick bit changes'
-        ])
-    elif category == 'Garden Equipment':
-        key_features.extend([
-            'Professional landscaping performance',
-            'Efficient fuel consumption',
-            'Adjustable cutting/operation settings',
-            'Easy maintenance and cleaning'
-        ])
-    elif category == 'Generators':
-        key_features.extend([
-            'Clean, stable power output',
-            'Automatic voltage regulation',
-            'Multiple output configurations',
-            'Fuel-efficient operation'
-        ])
+    key_features = [f'Professional {brand} quality and reliability', *MOCK_BASE_FEATURES,
+                    *MOCK_CATEGORY_FEATURES.get(category, ())]
     
     wordpress_content = {
         'suggested_title': title,
@@ -999,57 +1035,64 @@ Suitable for construction, maintenance, and specialized applications requiring p
             'company_name': brand,
             'features': key_features[:5],
             'analyzed': bool(manufacturer_website)
-        },
-        'generated_at': datetime.now().isoformat()
+        }
     }
 
+# Static widget options, built once per process rather than on every rerun
+CONTENT_TYPES = ("Product Description", "E-shot Campaign", "Social Media Post", "Blog Article")
+CONTENT_CATEGORIES = ("Construction Equipment", "Garden Tools", "Cleaning Equipment", "Safety Equipment", "Other")
+TARGET_AUDIENCES = ("Construction Professionals", "DIY Enthusiasts", "Commercial Cleaners", "General Public")
+TONES = ("Professional", "Friendly", "Technical", "Promotional")
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def generate_product_description_text(product_name: str, product_category: str, key_features: tuple,
+                                      target_audience: str, tone: str, word_count: int) -> str:
+    """Placeholder product description, cached so identical inputs return instantly"""
+    return f"""
+**{product_name}** - Professional Grade {product_category}
+
+{product_name} represents the pinnacle of {product_category.lower()} technology, designed specifically for {target_audience.lower()}. 
+
+Key Features:
+{chr(10).join(key_features)}
+
+This equipment delivers exceptional performance and reliability, making it the ideal choice for both professional and personal use. Our commitment to quality ensures that every piece of equipment meets the highest industry standards.
+
+Perfect for projects requiring precision and efficiency, {product_name} combines innovative design with practical functionality.
+    """
+
 def show_content_generator():
     st.header("✍️ Content Generator")
     
-    content_type = st.selectbox(
-        "What would you like to create?",
-        ["Product Description", "E-shot Campaign", "Social Media Post", "Blog Article"]
-    )
+    content_type = st.selectbox("What would you like to create?", CONTENT_TYPES)
     
     if content_type == "Product Description":
         st.subheader("📦 Product Description Generator")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            product_name = st.text_input("Product Name")
-            product_category = st.selectbox(
-                "Category",
-                ["Construction Equipment", "Garden Tools", "Cleaning Equipment", "Safety Equipment", "Other"]
-            )
-            key_features = st.text_area("Key Features (one per line)")
-        
-        with col2:
-            target_audience = st.selectbox(
-                "Target Audience",
-                ["Construction Professionals", "DIY Enthusiasts", "Commercial Cleaners", "General Public"]
-            )
-            tone = st.selectbox(
-                "Tone",
-                ["Professional", "Friendly", "Technical", "Promotional"]
-            )
-            word_count = st.slider("Word Count", 50, 500, 150)
+        # Inputs sit in a form so typing doesn't rerun the page; only Generate does
+        with st.form("product_desc"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                product_name = st.text_input("Product Name")
+                product_category = st.selectbox("Category", CONTENT_CATEGORIES)
+                key_features = st.text_area("Key Features (one per line)")
+                # Parsed once into a canonical, hashable form for the generators
+                key_features = tuple(line.strip() for line in key_features.splitlines() if line.strip())
+            
+            with col2:
+                target_audience = st.selectbox("Target Audience", TARGET_AUDIENCES)
+                tone = st.selectbox("Tone", TONES)
+                word_count = st.slider("Word Count", 50, 500, 150)
+            
+            submitted = st.form_submit_button("Generate Product Description")
         
-        if st.button("Generate Product Description"):
+        if submitted:
             with st.spinner("Generating product description..."):
                 # Placeholder for AI generation
-                generated_content = f"""
-**{product_name}** - Professional Grade {product_category}
-
-{product_name} represents the pinnacle of {product_category.lower()} technology, designed specifically for {target_audience.lower()}. 
-
-Key Features:
-{key_features}
-
-This equipment delivers exceptional performance and reliability, making it the ideal choice for both professional and personal use. Our commitment to quality ensures that every piece of equipment meets the highest industry standards.
-
-Perfect for projects requiring precision and efficiency, {product_name} combines innovative design with practical functionality.
-                """
+                generated_content = generate_product_description_text(
+                    product_name, product_category, key_features, target_audience, tone, word_count
+                )
                 
                 st.success("Product description generated!")
                 
@@ -1061,11 +1104,24 @@ Perfect for projects requiring precision and efficiency, {product_name} combines
                 st.text_area("Copy Content (Click to select all):", generated_content, height=300)
                 
                 # Add to history
-                st.session_state.chat_history.append({
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M"),
-                    'type': 'Product Description',
-                    'content': generated_content
-                })
+                log_activity('Product Description', generated_content)
+
+CAMPAIGN_TYPES = ("Seasonal Campaign", "Weather-Based Campaign", "Product Launch", "Promotional Campaign")
+CAMPAIGN_PRODUCTS = ("Water Pumps", "Dehumidifiers", "Heaters", "Garden Equipment", "Construction Tools")
+CAMPAIGN_COLUMNS = ('name', 'type', 'start_date', 'end_date', 'products', 'budget', 'status')
+
+def campaigns_table() -> "pd.DataFrame":
+    """Return the session's campaigns table, rebuilt only when campaigns_version changes"""
+    import pandas as pd
+    
+    # Memoized per session - a version number alone can't key a cross-session st.cache_data entry
+    cached = st.session_state.get('campaigns_table')
+    if cached is None or cached[0] != st.session_state.campaigns_version:
+        rows = [tuple(campaign.get(column) for column in CAMPAIGN_COLUMNS)
+                for campaign in st.session_state.campaigns]
+        cached = (st.session_state.campaigns_version, pd.DataFrame(rows, columns=list(CAMPAIGN_COLUMNS)))
+        st.session_state.campaigns_table = cached
+    return cached[1]
 
 def show_campaign_planner():
     st.header("📅 Campaign Planner")
@@ -1073,10 +1129,7 @@ def show_campaign_planner():
     st.subheader("Plan Your Marketing Campaigns")
     
     # Campaign type selection
-    campaign_type = st.selectbox(
-        "Campaign Type",
-        ["Seasonal Campaign", "Weather-Based Campaign", "Product Launch", "Promotional Campaign"]
-    )
+    campaign_type = st.selectbox("Campaign Type", CAMPAIGN_TYPES)
     
     col1, col2 = st.columns(2)
     
@@ -1086,10 +1139,7 @@ def show_campaign_planner():
         end_date = st.date_input("End Date")
     
     with col2:
-        target_products = st.multiselect(
-            "Target Products",
-            ["Water Pumps", "Dehumidifiers", "Heaters", "Garden Equipment", "Construction Tools"]
-        )
+        target_products = st.multiselect("Target Products", CAMPAIGN_PRODUCTS)
         budget = st.number_input("Budget (£)", min_value=0, value=1000)
     
     if st.button("Create Campaign Plan"):
@@ -1104,13 +1154,41 @@ def show_campaign_planner():
         }
         
         st.session_state.campaigns.append(campaign)
+        st.session_state.campaigns_version += 1
+        
+        # Persist in the background so the page doesn't wait on disk
+        tools = load_tools(get_campaign_write_queue)
+        if tools is not None:
+            tools[0].put(campaign)
         st.success(f"Campaign '{campaign_name}' created successfully!")
     
     # Show existing campaigns
     if st.session_state.campaigns:
         st.subheader("📋 Existing Campaigns")
-        campaigns_df = pd.DataFrame(st.session_state.campaigns)
-        st.dataframe(campaigns_df, use_container_width=True)
+        st.dataframe(campaigns_table(), use_container_width=True)
+
+# Placeholder weather-based recommendations
+WEATHER_RECOMMENDATIONS = (
+    MappingProxyType({
+        "condition": "Heavy Rain Expected",
+        "products": ("Water Pumps", "Dehumidifiers", "Wet Vacuum Cleaners"),
+        "action": "Create urgent e-shot campaign",
+        "priority": "High"
+    }),
+    MappingProxyType({
+        "condition": "Cold Weather Coming",
+        "products": ("Heaters", "Thermal Equipment", "Insulation Tools"),
+        "action": "Plan heating equipment promotion",
+        "priority": "Medium"
+    })
+)
+
+# (expander title, body markdown) per recommendation, formatted once at import
+WEATHER_RECOMMENDATION_TEXT = tuple(
+    (f"🎯 {rec['condition']} - {rec['priority']} Priority",
+     f"**Recommended Products:** {', '.join(rec['products'])}\n\n**Suggested Action:** {rec['action']}")
+    for rec in WEATHER_RECOMMENDATIONS
+)
 
 def show_weather_insights():
     st.header("🌤️ Weather Insights")
@@ -1129,88 +1207,47 @@ def show_weather_insights():
     
     st.subheader("📊 Marketing Recommendations")
     
-    # Weather-based recommendations
-    recommendations = [
-        {
-            "condition": "Heavy Rain Expected",
-            "products": ["Water Pumps", "Dehumidifiers", "Wet Vacuum Cleaners"],
-            "action": "Create urgent e-shot campaign",
-            "priority": "High"
-        },
-        {
-            "condition": "Cold Weather Coming",
-            "products": ["Heaters", "Thermal Equipment", "Insulation Tools"],
-            "action": "Plan heating equipment promotion",
-            "priority": "Medium"
-        }
-    ]
-    
-    for rec in recommendations:
-        with st.expander(f"🎯 {rec['condition']} - {rec['priority']} Priority"):
-            st.write(f"**Recommended Products:** {', '.join(rec['products'])}")
-            st.write(f"**Suggested Action:** {rec['action']}")
+    for rec, (title, body) in zip(WEATHER_RECOMMENDATIONS, WEATHER_RECOMMENDATION_TEXT):
+        with st.expander(title):
+            st.markdown(body)
             if st.button(f"Generate Campaign for {rec['condition']}", key=rec['condition']):
                 st.success("Campaign generated! Check Content Generator.")
 
+COMPETITORS = ("Speedy Hire", "HSS Hire", "City Hire", "National Tool Hire")
+
+# Placeholder competitor analysis
+COMPETITOR_ANALYSIS = MappingProxyType({
+    "Recent Promotions": ("20% off power tools", "Free delivery promotion"),
+    "Popular Products": ("Mini excavators", "Pressure washers", "Generators"),
+    "Social Media Activity": "High engagement on LinkedIn posts",
+    "Pricing Strategy": "Competitive pricing on weekend rentals"
+})
+
 def show_competitor_monitor():
     st.header("🔍 Competitor Monitor")
     
-    competitors = [
-        "Speedy Hire",
-        "HSS Hire", 
-        "City Hire",
-        "National Tool Hire"
-    ]
-    
-    selected_competitor = st.selectbox("Select Competitor", competitors)
+    selected_competitor = st.selectbox("Select Competitor", COMPETITORS)
     
     if st.button("Analyze Competitor Activity"):
         with st.spinner(f"Analyzing {selected_competitor}..."):
             # Placeholder analysis
             st.success(f"Analysis complete for {selected_competitor}")
             
-            analysis_data = {
-                "Recent Promotions": ["20% off power tools", "Free delivery promotion"],
-                "Popular Products": ["Mini excavators", "Pressure washers", "Generators"],
-                "Social Media Activity": "High engagement on LinkedIn posts",
-                "Pricing Strategy": "Competitive pricing on weekend rentals"
-            }
-            
-            for category, details in analysis_data.items():
+            for category, details in COMPETITOR_ANALYSIS.items():
                 with st.expander(category):
-                    if isinstance(details, list):
-                        for detail in details:
-                            st.write(f"• {detail}")
+                    if isinstance(details, tuple):
+                        st.markdown("\n".join(f"- {detail}" for detail in details))
                     else:
                         st.write(details)
 
-def show_social_media():
-    st.header("📱 Social Media Manager")
-    
-    platform = st.selectbox("Platform", ["LinkedIn", "Facebook", "Both"])
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        post_type = st.selectbox(
-            "Post Type",
-            ["Product Showcase", "Weather Alert", "Promotional", "Educational", "Behind the Scenes"]
-        )
-        
-        product_focus = st.multiselect(
-            "Featured Products",
-            ["Water Pumps", "Dehumidifiers", "Construction Equipment", "Garden Tools", "Safety Equipment"]
-        )
-    
-    with col2:
-        hashtags = st.text_area("Hashtags", "#toolhire #construction #london")
-        schedule_time = st.time_input("Schedule for")
-    
-    post_content = st.text_area("Post Content", height=150, placeholder="AI will generate content based on your selections...")
-    
-    if st.button("Generate Post"):
-        with st.spinner("Generating social media post..."):
-            generated_post = f"""
+PLATFORMS = ("LinkedIn", "Facebook", "Both")
+POST_TYPES = ("Product Showcase", "Weather Alert", "Promotional", "Educational", "Behind the Scenes")
+FEATURED_PRODUCTS = ("Water Pumps", "Dehumidifiers", "Construction Equipment", "Garden Tools", "Safety Equipment")
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def generate_social_post_text(platform: str, post_type: str, product_focus: tuple, hashtags: str) -> str:
+    """Placeholder social media post, cached so identical inputs return instantly"""
+    return f"""
 🔧 Looking for reliable {', '.join(product_focus) if product_focus else 'equipment'} hire in London?
 
 Our professional-grade equipment ensures your projects run smoothly, whatever the weather! 
@@ -1223,7 +1260,33 @@ Our professional-grade equipment ensures your projects run smoothly, whatever th
 Get in touch today! 
 
 {hashtags}
-            """
+    """
+
+def show_social_media():
+    st.header("📱 Social Media Manager")
+    
+    # Inputs sit in a form so editing them doesn't rerun the page; only Generate does
+    with st.form("social_post"):
+        platform = st.selectbox("Platform", PLATFORMS)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            post_type = st.selectbox("Post Type", POST_TYPES)
+        
+            product_focus = st.multiselect("Featured Products", FEATURED_PRODUCTS)
+        
+        with col2:
+            hashtags = st.text_area("Hashtags", "#toolhire #construction #london")
+            schedule_time = st.time_input("Schedule for")
+        
+        post_content = st.text_area("Post Content", height=150, placeholder="AI will generate content based on your selections...")
+        
+        submitted = st.form_submit_button("Generate Post")
+    
+    if submitted:
+        with st.spinner("Generating social media post..."):
+            generated_post = generate_social_post_text(platform, post_type, tuple(product_focus), hashtags)
             
             st.success("Post generated!")
             st.text_area("Generated Post:", generated_post, height=200)
@@ -1240,11 +1303,12 @@ def show_style_guide_training():
     st.header("📚 Style Guide & AI Training")
     st.subheader("Train the AI agent with your feedback and preferences")
     
-    if not TOOLS_AVAILABLE or 'style_guide_manager' not in st.session_state:
+    tools = load_tools(get_style_guide_manager)
+    if tools is None:
         st.error("Style guide manager not available")
         return
     
-    style_manager = st.session_state.style_guide_manager
+    style_manager = tools[0]
     
     # Tabs for different sections
     tab1, tab2, tab3, tab4 = st.tabs(["📖 Current Style Guide", "📝 Add Feedback", "✅ Approve/Reject Content", "📊 Learning History"])
@@ -1373,26 +1437,45 @@ def show_style_guide_training():
         with col3:
             st.metric("Rejected Examples", len(style_manager.style_guide.get('rejected_examples', [])))
 
+# Sample data for demonstration, as (column, values) pairs so it can key the caches below
+SAMPLE_CAMPAIGN_PERFORMANCE = (
+    ('Campaign', ('Water Pump Promo', 'Winter Heating', 'Spring Garden')),
+    ('Clicks', (150, 89, 234)),
+    ('Conversions', (12, 8, 19)),
+    ('ROI (%)', (15.2, 12.8, 18.5))
+)
+
+@st.cache_data(show_spinner=False)
+def build_performance_df(data: tuple) -> "pd.DataFrame":
+    """Campaign performance table"""
+    import pandas as pd
+    
+    return pd.DataFrame({column: list(values) for column, values in data})
+
+@st.cache_data(show_spinner=False)
+def build_performance_chart(data: tuple) -> "alt.Chart":
+    """Clicks and conversions per campaign as a line chart"""
+    import altair as alt
+    
+    return alt.Chart(build_performance_df(data)).transform_fold(
+        ['Clicks', 'Conversions'], as_=['Metric', 'Value']
+    ).mark_line().encode(
+        x=alt.X('Campaign:N', sort=None),
+        y='Value:Q',
+        color='Metric:N'
+    )
+
 def show_analytics():
     st.header("📈 Analytics & Performance")
     
     # Placeholder analytics data
     st.subheader("📊 Campaign Performance")
     
-    # Sample data for demonstration
-    campaign_data = {
-        'Campaign': ['Water Pump Promo', 'Winter Heating', 'Spring Garden'],
-        'Clicks': [150, 89, 234],
-        'Conversions': [12, 8, 19],
-        'ROI (%)': [15.2, 12.8, 18.5]
-    }
-    
-    df = pd.DataFrame(campaign_data)
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(build_performance_df(SAMPLE_CAMPAIGN_PERFORMANCE), use_container_width=True)
     
     # Chart
     st.subheader("📈 Performance Trends")
-    st.line_chart(df.set_index('Campaign')[['Clicks', 'Conversions']])
+    st.altair_chart(build_performance_chart(SAMPLE_CAMPAIGN_PERFORMANCE), use_container_width=True)
 
 def show_settings():
     st.header("⚙️ Settings")
@@ -1400,31 +1483,79 @@ def show_settings():
     st.subheader("🔧 Configuration")
     
     # API Settings
+    # Each section is a form so edits only rerun the script on submit
     with st.expander("API Configuration"):
-        weather_api_key = st.text_input("Weather API Key", type="password")
-        openai_api_key = st.text_input("OpenAI API Key (Optional)", type="password")
+        with st.form("api_config"):
+            weather_api_key = st.text_input("Weather API Key", type="password")
+            openai_api_key = st.text_input("OpenAI API Key (Optional)", type="password")
+            submitted = st.form_submit_button("Save API Keys")
         
-        if st.button("Save API Keys"):
+        if submitted:
             st.success("API keys saved!")
     
     # File Upload Settings
     with st.expander("Data Files"):
         st.write("Upload your business data files:")
         
-        tone_file = st.file_uploader("Tone Guidelines Document", type=['txt', 'docx', 'pdf'])
-        stock_file = st.file_uploader("Stock Data Spreadsheet", type=['xlsx', 'csv'])
-        seasonal_file = st.file_uploader("Seasonal Information", type=['xlsx', 'csv'])
+        with st.form("data_files"):
+            tone_file = st.file_uploader("Tone Guidelines Document", type=['txt', 'docx', 'pdf'])
+            stock_file = st.file_uploader("Stock Data Spreadsheet", type=['xlsx', 'csv'])
+            seasonal_file = st.file_uploader("Seasonal Information", type=['xlsx', 'csv'])
+            submitted = st.form_submit_button("Upload Files")
         
-        if st.button("Upload Files"):
+        if submitted:
             st.success("Files uploaded successfully!")
     
     # Website Settings
     with st.expander("Website Configuration"):
-        website_url = st.text_input("Your Website URL")
-        product_pages = st.text_area("Product Page URLs (one per line)")
+        with st.form("website_config"):
+            website_url = st.text_input("Your Website URL")
+            product_pages = st.text_area("Product Page URLs (one per line)")
+            submitted = st.form_submit_button("Save Website Settings")
         
-        if st.button("Save Website Settings"):
+        if submitted:
             st.success("Website settings saved!")
+    
+    # Cached generation results
+    with st.expander("Cache"):
+        st.write("Generated product content is reused for up to an hour for repeat codes and inputs.")
+        if st.button("Clear Generated Content Cache"):
+            cached_generate_product_content.clear()
+            generate_mock_product_content.clear()
+            st.success("Generated content cache cleared!")
+    
+    # Long-term memory logs
+    with st.expander("Memory"):
+        st.write("Export stored conversations, campaigns, generated content and insights as readable JSON.")
+        if st.button("📤 Export Memory"):
+            tools = load_tools(get_memory_system)
+            if tools is not None:
+                memory_system, = tools
+                st.download_button(
+                    "⬇️ Download Memory Export",
+                    memory_system.export_pretty(),
+                    file_name="memory_export.json",
+                    mime="application/json"
+                )
+
+# Pages the dashboard's quick actions switch to
+CONTENT_PAGE = st.Page(show_content_generator, title="Content Generator", url_path="content")
+WEATHER_PAGE = st.Page(show_weather_insights, title="Weather Insights", url_path="weather")
+SOCIAL_PAGE = st.Page(show_social_media, title="Social Media", url_path="social")
+
+# Sidebar pages, in navigation order
+PAGES = [
+    st.Page(show_dashboard, title="Dashboard", url_path="dashboard", default=True),
+    st.Page(show_new_product_description, title="New Product Description", url_path="new-product"),
+    CONTENT_PAGE,
+    st.Page(show_campaign_planner, title="Campaign Planner", url_path="campaigns"),
+    WEATHER_PAGE,
+    st.Page(show_competitor_monitor, title="Competitor Monitor", url_path="competitors"),
+    SOCIAL_PAGE,
+    st.Page(show_analytics, title="Analytics", url_path="analytics"),
+    st.Page(show_style_guide_training, title="Style Guide & Training", url_path="style-guide"),
+    st.Page(show_settings, title="Settings", url_path="settings")
+]
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -37,6 +37,9 @@ class ExcelProductHandler:
         self.csv_file_path = None
         self.product_data = None
         self.manufacturer_cache = {}
+        self._csv_info_cache = None  # (cache key, info) for get_csv_info
+        self._loaded_csv = None  # (path, mtime) of the CSV behind product_data
+        self._stock_index = None  # (product_data it was built from, upper-cased code -> row position)
         
         # Automatically find CSV file in data folder
         self._find_csv_file()
@@ -94,6 +97,11 @@ class ExcelProductHandler:
             print("No CSV file found. Using sample data.")
             return self._create_sample_product_data()
         
+        # Skip the parse when the same file hasn't changed since it was loaded
+        csv_key = (self.csv_file_path, os.path.getmtime(self.csv_file_path))
+        if self.product_data is not None and self._loaded_csv == csv_key:
+            return self.product_data
+        
         try:
             print(f"Loading product data from: {self.csv_file_path}")
             
@@ -107,6 +115,7 @@ class ExcelProductHandler:
             
             # Handle WordPress CSV format
             self.product_data = self._process_wordpress_csv(df)
+            self._loaded_csv = csv_key
             
             print(f"Loaded {len(self.product_data)} products from CSV")
             return self.product_data
@@ -123,12 +132,10 @@ class ExcelProductHandler:
             self.product_data = self.load_product_data()
         
         # Find product with matching stock number
-        matching_products = self.product_data[
-            self.product_data['stock_number'].str.upper() == product_code.upper()
-        ]
+        position = self._get_stock_index().get(product_code.upper())
         
-        if len(matching_products) > 0:
-            row = matching_products.iloc[0]
+        if position is not None:
+            row = self.product_data.iloc[position]
             product = {
                 'stock_number': row.get('stock_number', ''),
                 'title': row.get('title', ''),
@@ -160,6 +167,17 @@ class ExcelProductHandler:
                 'found': False
             }
     
+    def _get_stock_index(self) -> Dict[str, int]:
+        """Map upper-cased stock numbers to their first row, rebuilt only when product_data is replaced"""
+        
+        if self._stock_index is None or self._stock_index[0] is not self.product_data:
+            index = {}
+            for position, code in enumerate(self.product_data['stock_number']):
+                if isinstance(code, str):
+                    index.setdefault(code.upper(), position)
+            self._stock_index = (self.product_data, index)
+        return self._stock_index[1]
+    
     def get_products_by_category(self, category: str, limit: int = 10) -> List[Dict]:
         """Get products from the same category for style analysis"""
         
@@ -861,6 +879,19 @@ class ExcelProductHandler:
         
         from datetime import datetime
         
+        # One stat call; the info is rebuilt only when the file or loaded data changes
+        try:
+            stat = os.stat(self.csv_file_path) if self.csv_file_path else None
+        except OSError:
+            stat = None
+        
+        product_count = len(self.product_data) if self.product_data is not None else 0
+        cache_key = (self.csv_file_path, stat and stat.st_mtime, stat and stat.st_size, product_count)
+        if self._csv_info_cache is not None and self._csv_info_cache[0] == cache_key:
+            info = self._csv_info_cache[1]
+            # Callers get their own copy so they can't alter the cached info
+            return {**info, 'sample_columns': list(info['sample_columns'])}
+        
         info = {
             'csv_file_path': self.csv_file_path,
             'file_exists': False,
@@ -870,13 +901,14 @@ class ExcelProductHandler:
             'sample_columns': []
         }
         
-        if self.csv_file_path and os.path.exists(self.csv_file_path):
+        if stat is not None:
             info['file_exists'] = True
-            info['file_size'] = os.path.getsize(self.csv_file_path)
-            info['last_modified'] = datetime.fromtimestamp(os.path.getmtime(self.csv_file_path))
+            info['file_size'] = stat.st_size
+            info['last_modified'] = datetime.fromtimestamp(stat.st_mtime)
             
             if self.product_data is not None:
-                info['total_products'] = len(self.product_data)
+                info['total_products'] = product_count
                 info['sample_columns'] = list(self.product_data.columns)[:10]  # First 10 columns
         
+        self._csv_info_cache = (cache_key, {**info, 'sample_columns': list(info['sample_columns'])})
         return info
\ No newline at end of file